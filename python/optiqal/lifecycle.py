@@ -134,58 +134,83 @@ def interpolate_table(table: dict, age: float) -> float:
         return lower_val + fraction * (upper_val - lower_val)
 
 
-def get_mortality_rate(age: float, sex: Literal["male", "female"]) -> float:
-    """Get annual mortality rate (qx) for given age and sex."""
-    return interpolate_table(CDC_LIFE_TABLE[sex], age)
-
-
-def get_cause_fraction(age: float) -> dict:
-    """Get cause-of-death fractions for given age."""
-    ages = sorted(CAUSE_FRACTIONS.keys())
+def _interpolate_linear(table: dict, age: float) -> float:
+    """Linear interpolation for non-mortality tables."""
+    ages = sorted(table.keys())
 
     if age <= ages[0]:
-        return CAUSE_FRACTIONS[ages[0]].copy()
+        return table[ages[0]]
     if age >= ages[-1]:
-        return CAUSE_FRACTIONS[ages[-1]].copy()
+        return table[ages[-1]]
 
     for i in range(len(ages) - 1):
         if ages[i] <= age < ages[i + 1]:
             lower_age, upper_age = ages[i], ages[i + 1]
             break
     else:
-        return CAUSE_FRACTIONS[ages[-1]].copy()
+        return table[ages[-1]]
 
     fraction = (age - lower_age) / (upper_age - lower_age)
-    lower = CAUSE_FRACTIONS[lower_age]
-    upper = CAUSE_FRACTIONS[upper_age]
+    return table[lower_age] + fraction * (table[upper_age] - table[lower_age])
+
+
+# Interpolated lookup tables, precomputed once at import as contiguous arrays.
+# The per-year simulation loops hit these lookups thousands of times; integer
+# ages resolve to an O(1) array index instead of re-running the interpolation.
+_MAX_TABLE_AGE = 120
+_SEX_IDX = {"male": 0, "female": 1}
+_CAUSE_KEYS = ("cvd", "cancer", "other")
+
+_MORTALITY = np.array(
+    [
+        [interpolate_table(CDC_LIFE_TABLE[sex], age) for age in range(_MAX_TABLE_AGE + 1)]
+        for sex in ("male", "female")
+    ]
+)  # (2, 121)
+
+_CAUSE = np.array(
+    [
+        [
+            _interpolate_linear(
+                {a: fracs[k] for a, fracs in CAUSE_FRACTIONS.items()}, age
+            )
+            for k in _CAUSE_KEYS
+        ]
+        for age in range(_MAX_TABLE_AGE + 1)
+    ]
+)  # (121, 3)
+
+_QWEIGHT = np.array(
+    [_interpolate_linear(QUALITY_WEIGHTS, age) for age in range(_MAX_TABLE_AGE + 1)]
+)  # (121,)
+
+
+def get_mortality_rate(age: float, sex: Literal["male", "female"]) -> float:
+    """Get annual mortality rate (qx) for given age and sex."""
+    idx = int(age)
+    if idx == age:
+        return float(_MORTALITY[_SEX_IDX[sex], min(max(idx, 0), _MAX_TABLE_AGE)])
+    return interpolate_table(CDC_LIFE_TABLE[sex], age)
 
+
+def get_cause_fraction(age: float) -> dict:
+    """Get cause-of-death fractions for given age."""
+    idx = int(age)
+    if idx == age:
+        row = _CAUSE[min(max(idx, 0), _MAX_TABLE_AGE)]
+        return {k: float(row[i]) for i, k in enumerate(_CAUSE_KEYS)}
     return {
-        "cvd": lower["cvd"] + fraction * (upper["cvd"] - lower["cvd"]),
-        "cancer": lower["cancer"] + fraction * (upper["cancer"] - lower["cancer"]),
-        "other": lower["other"] + fraction * (upper["other"] - lower["other"]),
+        k: _interpolate_linear({a: fracs[k] for a, fracs in CAUSE_FRACTIONS.items()}, age)
+        for k in _CAUSE_KEYS
     }
 
 
 def get_quality_weight(age: float) -> float:
     """Get quality weight for given age."""
-    ages = sorted(QUALITY_WEIGHTS.keys())
-
-    if age <= ages[0]:
-        return QUALITY_WEIGHTS[ages[0]]
-    if age >= ages[-1]:
-        return QUALITY_WEIGHTS[ages[-1]]
-
-    for i in range(len(ages) - 1):
-        if ages[i] <= age < ages[i + 1]:
-            lower_age, upper_age = ages[i], ages[i + 1]
-            break
-    else:
-        return QUALITY_WEIGHTS[ages[-1]]
-
-    fraction = (age - lower_age) / (upper_age - lower_age)
-    return QUALITY_WEIGHTS[lower_age] + fraction * (
-        QUALITY_WEIGHTS[upper_age] - QUALITY_WEIGHTS[lower_age]
-    )
+    idx = int(age)
+    if idx == age:
+        return float(_QWEIGHT[min(max(idx, 0), _MAX_TABLE_AGE)])
+    return _interpolate_linear(QUALITY_WEIGHTS, age)
 
 
 # Precomputed baselines cache
@@ -222,8 +247,8 @@ def get_precomputed_baseline_qalys(
 
     try:
         baselines = load_precomputed_baselines()
-        return baselines["remaining_qalys"][sex][str(age)]
-    except (KeyError, FileNotFoundError):
+        return baselines["remaining_qalys"][sex][age]
+    except (KeyError, IndexError, FileNotFoundError):
         return None
 
 
@@ -245,8 +270,8 @@ def get_precomputed_life_expectancy(
 
     try:
         baselines = load_precomputed_baselines()
-        return baselines["life_expectancy"][sex][str(age)]
-    except (KeyError, FileNotFoundError):
+        return baselines["life_expectancy"][sex][age]
+    except (KeyError, IndexError, FileNotFoundError):
         return None
 
 
@@ -310,6 +335,32 @@ class LifecycleModel:
                 start_age, sex
             )
 
+        # Specialize the model for its fixed (start_age, sex, discount_rate):
+        # precompute all per-year tables and the baseline survival curve once,
+        # so each calculate() call reduces to a handful of array ops. This
+        # pays off when one model instance is reused across many HR samples.
+        years = np.arange(max_age - start_age)
+        ages = start_age + years
+
+        self._base_qx = np.minimum(
+            np.array([get_mortality_rate(int(a), sex) for a in ages])
+            * baseline_mortality_multiplier,
+            0.99,
+        )
+        self._cause_fracs = np.array(
+            [[get_cause_fraction(int(a))[k] for k in _CAUSE_KEYS] for a in ages]
+        )  # (n_years, 3)
+        quality = np.array([get_quality_weight(int(a)) for a in ages])
+        discount = (1 / (1 + discount_rate)) ** years
+        self._qd = quality * discount  # per-year QALY weight while alive
+
+        # Start-of-year baseline survival
+        self._baseline_survival = np.concatenate(
+            [[1.0], np.cumprod(1 - self._base_qx)[:-1]]
+        )
+        self._baseline_qalys = float(np.sum(self._baseline_survival * self._qd))
+        self._baseline_life_years = float(np.sum(self._baseline_survival))
+
     def calculate(self, pathway_hrs: PathwayHRs) -> LifecycleResult:
         """
         Calculate lifetime QALYs with and without intervention.
@@ -321,104 +372,38 @@ class LifecycleModel:
         Returns:
             LifecycleResult with baseline, intervention, and gain QALYs.
         """
-        # Use precomputed baseline if available (fast path)
-        # Only for default population (no mortality adjustment)
+        # Use precomputed baseline QALYs if available (default population),
+        # otherwise the survival curve computed at construction
         if self._precomputed_baseline_qalys is not None:
             baseline_qalys = self._precomputed_baseline_qalys
-            # Still need to compute baseline_life_years
-            baseline_survival = 1.0
-            baseline_life_years = 0.0
-            for year in range(self.max_age - self.start_age):
-                current_age = self.start_age + year
-                base_qx = get_mortality_rate(current_age, self.sex)
-                baseline_life_years += baseline_survival
-                baseline_survival *= 1 - base_qx
-                if baseline_survival < 0.001:
-                    break
         else:
-            # Full computation path (used when mortality is adjusted)
-            baseline_qalys = 0.0
-            baseline_survival = 1.0
-            baseline_life_years = 0.0
-
-            for year in range(self.max_age - self.start_age):
-                current_age = self.start_age + year
-                # Apply mortality multiplier for risk factors (BMI, smoking, diabetes)
-                base_qx = get_mortality_rate(current_age, self.sex) * self.baseline_mortality_multiplier
-                # Cap at 1.0 (can't have >100% mortality probability)
-                base_qx = min(base_qx, 0.99)
-                quality = get_quality_weight(current_age)
-                discount = 1 / (1 + self.discount_rate) ** year
-
-                baseline_qaly = baseline_survival * quality * discount
-                baseline_qalys += baseline_qaly
-                baseline_life_years += baseline_survival
-
-                baseline_survival *= 1 - base_qx
-
-                if baseline_survival < 0.001:
-                    break
-
-        # Always compute intervention path
-        intervention_qalys = 0.0
-        intervention_life_years = 0.0
-
-        cvd_contribution = 0.0
-        cancer_contribution = 0.0
-        other_contribution = 0.0
-
-        baseline_survival = 1.0
-        intervention_survival = 1.0
-
-        for year in range(self.max_age - self.start_age):
-            current_age = self.start_age + year
-            # Apply mortality multiplier for risk factors
-            base_qx = get_mortality_rate(current_age, self.sex) * self.baseline_mortality_multiplier
-            base_qx = min(base_qx, 0.99)
-            cause_frac = get_cause_fraction(current_age)
-            quality = get_quality_weight(current_age)
-            discount = 1 / (1 + self.discount_rate) ** year
-
-            # Baseline QALY (for pathway contribution tracking)
-            baseline_qaly = baseline_survival * quality * discount
-
-            # Intervention mortality rate (intervention HR applies to the adjusted baseline)
-            intervention_qx = base_qx * (
-                cause_frac["cvd"] * pathway_hrs.cvd
-                + cause_frac["cancer"] * pathway_hrs.cancer
-                + cause_frac["other"] * pathway_hrs.other
-            )
+            baseline_qalys = self._baseline_qalys
+        baseline_life_years = self._baseline_life_years
+
+        # Intervention mortality: per-year cause-weighted HR applied to the
+        # (already multiplier-adjusted) baseline rates
+        hr_vec = np.array([pathway_hrs.cvd, pathway_hrs.cancer, pathway_hrs.other])
+        intervention_qx = np.minimum(self._base_qx * (self._cause_fracs @ hr_vec), 0.99)
+        intervention_survival = np.concatenate(
+            [[1.0], np.cumprod(1 - intervention_qx)[:-1]]
+        )
+
+        intervention_qalys = float(np.sum(intervention_survival * self._qd))
+        intervention_life_years = float(np.sum(intervention_survival))
 
-            # Intervention QALY
-            intervention_qaly = intervention_survival * quality * discount
-            intervention_qalys += intervention_qaly
-            intervention_life_years += intervention_survival
-
-            # Track pathway contributions
-            qaly_diff = intervention_qaly - baseline_qaly
-            if qaly_diff > 0:
-                total_reduction = (
-                    cause_frac["cvd"] * (1 - pathway_hrs.cvd)
-                    + cause_frac["cancer"] * (1 - pathway_hrs.cancer)
-                    + cause_frac["other"] * (1 - pathway_hrs.other)
-                )
-                if total_reduction > 0:
-                    cvd_contribution += (
-                        qaly_diff * cause_frac["cvd"] * (1 - pathway_hrs.cvd)
-                    ) / total_reduction
-                    cancer_contribution += (
-                        qaly_diff * cause_frac["cancer"] * (1 - pathway_hrs.cancer)
-                    ) / total_reduction
-                    other_contribution += (
-                        qaly_diff * cause_frac["other"] * (1 - pathway_hrs.other)
-                    ) / total_reduction
-
-            # Update survival
-            baseline_survival *= 1 - base_qx
-            intervention_survival *= 1 - intervention_qx
-
-            if baseline_survival < 0.001 and intervention_survival < 0.001:
-                break
+        # Pathway contributions: attribute each year's QALY gain
+        # proportionally to the mortality reduction on each pathway
+        qaly_diff = np.maximum(
+            (intervention_survival - self._baseline_survival) * self._qd, 0.0
+        )
+        reduction = self._cause_fracs * (1 - hr_vec)  # (n_years, 3)
+        total_reduction = np.sum(reduction, axis=1)
+        safe_total = np.where(total_reduction > 0, total_reduction, 1.0)
+        share = np.where(total_reduction[:, None] > 0, reduction / safe_total[:, None], 0.0)
+        contributions = qaly_diff @ share  # (3,)
+        cvd_contribution, cancer_contribution, other_contribution = (
+            float(c) for c in contributions
+        )
 
         return LifecycleResult(
             baseline_qalys=baseline_qalys,
@@ -348,6 +348,183 @@ def simulate_lifetime_markov(
     )
 
 
+# Per-year lookup curves shared by all batch simulations with the same
+# (start_age, sex, max_age) - e.g. the 1,152-profile baseline grid reuses
+# a handful of (age, sex) combinations thousands of times
+_BATCH_CURVES: dict = {}
+
+
+def _batch_curves(start_age: int, sex: str, max_age: int) -> tuple:
+    """Quality, mortality, and per-condition incidence curves by year."""
+    key = (start_age, sex, max_age)
+    cached = _BATCH_CURVES.get(key)
+    if cached is None:
+        ages = range(start_age, max_age)
+        quality = np.array([get_quality_weight(a) for a in ages])
+        mortality = np.array([get_mortality_rate(a, sex) for a in ages])
+        incidence = np.array(
+            [[get_incidence_rate(c, a) for a in ages] for c in INCIDENCE_RATES]
+        )
+        cached = (quality, mortality, incidence)
+        _BATCH_CURVES[key] = cached
+    return cached
+
+
+def simulate_lifetime_markov_batch(
+    start_age: int,
+    sex: Literal["male", "female"],
+    n_samples: int,
+    intervention_hr: float = 1.0,
+    initial_state: Optional[HealthState] = None,
+    discount_rate: float = 0.03,
+    max_age: int = 100,
+    rng: Optional[np.random.Generator] = None,
+    antithetic: bool = False,
+) -> tuple:
+    """
+    Simulate many lifetimes at once using vectorized Markov transitions.
+
+    Statistically equivalent to calling simulate_lifetime_markov n_samples
+    times, but carries all trajectories as NumPy arrays and steps year-by-year
+    with vector ops - roughly two orders of magnitude faster for typical
+    sample counts.
+
+    Args:
+        start_age: Starting age
+        sex: Biological sex for mortality lookup
+        n_samples: Number of lifetimes to simulate
+        intervention_hr: Hazard ratio for intervention (< 1 = reduced mortality)
+        initial_state: Starting health state applied to all samples (default: healthy)
+        discount_rate: Annual discount rate
+        max_age: Maximum simulation age
+        rng: Random number generator
+        antithetic: Pair each sample with its antithetic (u, 1 - u) partner,
+            reducing variance of means/medians at the same n_samples.
+            Requires an even n_samples.
+
+    Returns:
+        (qalys, life_years) tuple of float arrays, each shape (n_samples,)
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    conditions = list(INCIDENCE_RATES.keys())
+
+    # Condition states as boolean vectors, seeded from the initial state
+    states = {}
+    for cond in conditions:
+        has_it = initial_state is not None and getattr(initial_state, cond)
+        states[cond] = np.full(n_samples, has_it, dtype=bool)
+
+    alive = np.ones(n_samples, dtype=bool)
+    qalys = np.zeros(n_samples)
+    life_years = np.zeros(n_samples)
+
+    # One vectorized draw for the whole simulation: per year, one row of
+    # uniforms per condition plus one for death. Filling the buffer in a
+    # single RNG call is much cheaper than hundreds of per-year draws and
+    # consumes the generator stream in the same order.
+    n_years = max_age - start_age
+    if antithetic:
+        if n_samples % 2:
+            raise ValueError("antithetic sampling requires an even n_samples")
+        half = rng.random((n_years, len(conditions) + 1, n_samples // 2))
+        draws = np.concatenate([half, 1.0 - half], axis=2)
+    else:
+        draws = rng.random((n_years, len(conditions) + 1, n_samples))
+
+    # Shared per-year curves replace per-year get_* calls inside the loop
+    quality_curve, mortality_curve, incidence_curve = _batch_curves(
+        start_age, sex, max_age
+    )
+    discount_curve = 1.0 / (1.0 + discount_rate) ** np.arange(n_years)
+
+    for year in range(n_years):
+        if not alive.any():
+            break
+
+        discount = discount_curve[year]
+
+        # Quality weight with condition decrements
+        base_quality = quality_curve[year]
+        decrement = np.zeros(n_samples)
+        for cond in conditions:
+            decrement += states[cond] * CONDITION_DECREMENTS.get(cond, 0)
+        quality = np.maximum(0.1, base_quality - decrement)
+
+        qalys += alive * quality * discount
+        life_years += alive
+
+        # Check for new conditions
+        for j, cond in enumerate(conditions):
+            states[cond] |= draws[year, j] < incidence_curve[j, year]
+
+        # Check for death
+        base_mortality = mortality_curve[year]
+        multiplier = np.ones(n_samples)
+        for cond in conditions:
+            multiplier *= np.where(
+                states[cond], CONDITION_MORTALITY_MULTIPLIERS[cond], 1.0
+            )
+        mortality = np.minimum(base_mortality * multiplier * intervention_hr, 0.99)
+
+        alive &= draws[year, -1] >= mortality
+
+    return qalys, life_years
+
+
+def life_expectancy_exact(profile, max_age: int = 100) -> float:
+    """
+    Expected age at death for a profile, computed without Monte Carlo.
+
+    Walks the same annual bookkeeping as the Markov simulator but carries
+    expectations instead of samples: survival follows the deterministic
+    product of (1 - q_t), and condition states are tracked as acquisition
+    probabilities (a mean-field approximation of the stochastic onset
+    process). Useful for tests and callers that need only the central
+    estimate - it is exact up to that approximation and costs microseconds.
+
+    Args:
+        profile: Demographic profile (diabetes/hypertension seed the
+            initial condition probabilities; other conditions start absent)
+        max_age: Maximum age considered
+
+    Returns:
+        Expected age at death (profile.age + expected remaining life years)
+    """
+    from .profile import get_baseline_mortality_multiplier
+
+    baseline_mult = get_baseline_mortality_multiplier(profile)
+
+    conditions = list(INCIDENCE_RATES.keys())
+    p_cond = {cond: 0.0 for cond in conditions}
+    p_cond["diabetes"] = float(profile.has_diabetes)
+    p_cond["hypertension"] = float(profile.has_hypertension)
+
+    survival = 1.0
+    expected_years = 0.0
+
+    for age in range(profile.age, max_age):
+        # Alive at start of year counts a full year, as in the simulator
+        expected_years += survival
+
+        # Condition onset: p' = p + (1 - p) * incidence
+        for cond in conditions:
+            p_cond[cond] += (1.0 - p_cond[cond]) * get_incidence_rate(cond, age)
+
+        # Expected mortality multiplier under independent condition states
+        multiplier = baseline_mult
+        for cond in conditions:
+            multiplier *= 1.0 + p_cond[cond] * (
+                CONDITION_MORTALITY_MULTIPLIERS[cond] - 1.0
+            )
+
+        mortality = min(get_mortality_rate(age, profile.sex) * multiplier, 0.99)
+        survival *= 1.0 - mortality
+
+    return profile.age + expected_years
+
+
 def simulate_lifetime_paired(
     start_age: int,
     sex: Literal["male", "female"],
@@ -13,7 +13,7 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 
 from .intervention import Intervention
-from .simulate import simulate_qaly, simulate_qaly_profile, simulate_qaly_profile_vectorized, SimulationResult
+from .simulate import simulate_qaly, simulate_qaly_vectorized, simulate_qaly_profile, simulate_qaly_profile_vectorized, SimulationResult
 from .profile import Profile, generate_all_profiles, count_profiles
 
 try:
@@ -23,6 +23,47 @@ try:
 except ImportError:
     HAS_BAYESIAN = False
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _round_floats(obj, ndigits: int = 4):
+    """
+    Round all floats in a nested structure before serialization.
+
+    The precomputed artifacts feed UI display; four decimals (~1e-4 QALYs)
+    is ample precision and roughly halves the serialized size.
+    """
+    if isinstance(obj, float):
+        return round(obj, ndigits)
+    if isinstance(obj, dict):
+        return {k: _round_floats(v, ndigits) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_round_floats(v, ndigits) for v in obj]
+    return obj
+
+
+def _dumps_json(obj: dict) -> bytes:
+    """Serialize a result dict to indented JSON (orjson when available)."""
+    obj = _round_floats(obj)
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, indent=2).encode()
+
+
+def _loads_json(path: Path) -> dict:
+    """Parse a JSON results file (orjson when available)."""
+    data = Path(path).read_bytes()
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclass
 class PrecomputedResult:
@@ -78,18 +119,17 @@ class PrecomputedIntervention:
 
     def to_json(self) -> str:
         """Export as JSON for TypeScript consumption."""
-        return json.dumps(asdict(self), indent=2)
+        return _dumps_json(asdict(self)).decode()
 
     def save(self, path: Path):
         """Save to JSON file."""
         path = Path(path)
-        path.write_text(self.to_json())
+        path.write_bytes(_dumps_json(asdict(self)))
 
     @classmethod
     def load(cls, path: Path) -> "PrecomputedIntervention":
         """Load from JSON file."""
-        path = Path(path)
-        data = json.loads(path.read_text())
+        data = _loads_json(path)
 
         # Reconstruct PrecomputedResult objects
         results = {}
@@ -133,10 +173,10 @@ def precompute_intervention(
         PrecomputedIntervention with results for all age/sex combinations
     """
     results = {}
-    all_qaly_gains = []
+    qaly_medians = np.empty(len(ages) * len(sexes))
 
-    for age in ages:
-        for sex in sexes:
+    for i, age in enumerate(ages):
+        for j, sex in enumerate(sexes):
             key = f"{age}_{sex}"
 
             if use_mcmc and HAS_BAYESIAN:
@@ -174,8 +214,8 @@ def precompute_intervention(
                     method="mcmc",
                 )
             else:
-                # Fast Monte Carlo
-                sim_result = simulate_qaly(
+                # Fast Monte Carlo (fused vectorized kernel)
+                sim_result = simulate_qaly_vectorized(
                     intervention,
                     age=age,
                     sex=sex,
@@ -206,14 +246,14 @@ def precompute_intervention(
                 )
 
             results[key] = result
-            all_qaly_gains.append(result.qaly_median)
+            qaly_medians[i * len(sexes) + j] = result.qaly_median
 
-    # Summary statistics
+    # Summary statistics over the contiguous per-profile array
     summary = {
-        "qaly_median_all": float(np.median(all_qaly_gains)),
-        "qaly_mean_all": float(np.mean(all_qaly_gains)),
-        "qaly_min": float(np.min(all_qaly_gains)),
-        "qaly_max": float(np.max(all_qaly_gains)),
+        "qaly_median_all": float(np.median(qaly_medians)),
+        "qaly_mean_all": float(qaly_medians.mean()),
+        "qaly_min": float(qaly_medians.min()),
+        "qaly_max": float(qaly_medians.max()),
     }
 
     return PrecomputedIntervention(
@@ -226,39 +266,55 @@ def precompute_intervention(
     )
 
 
+def _precompute_one_intervention(
+    yaml_file: Path, output_dir: Path, kwargs: dict
+) -> PrecomputedIntervention:
+    """Worker for precompute_all_interventions (module-level for pickling)."""
+    intervention = Intervention.from_yaml(yaml_file)
+    precomputed = precompute_intervention(intervention, **kwargs)
+    precomputed.save(output_dir / f"{intervention.id}.json")
+    return precomputed
+
+
 def precompute_all_interventions(
     intervention_dir: Path,
     output_dir: Path,
+    max_workers: Optional[int] = None,
     **kwargs,
 ) -> List[PrecomputedIntervention]:
     """
     Precompute all interventions from a directory.
 
+    Interventions are independent, so they are processed in parallel across
+    a process pool (one task per YAML file).
+
     Args:
         intervention_dir: Directory containing YAML intervention files
         output_dir: Directory to save JSON results
+        max_workers: Number of worker processes (default: CPU count)
         **kwargs: Arguments to pass to precompute_intervention
 
     Returns:
-        List of PrecomputedIntervention objects
+        List of PrecomputedIntervention objects, in sorted file order
     """
     intervention_dir = Path(intervention_dir)
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    results = []
-
-    for yaml_file in intervention_dir.glob("*.yaml"):
-        print(f"Processing {yaml_file.name}...")
+    yaml_files = sorted(intervention_dir.glob("*.yaml"))
 
-        intervention = Intervention.from_yaml(yaml_file)
-        precomputed = precompute_intervention(intervention, **kwargs)
+    results = []
 
-        output_file = output_dir / f"{intervention.id}.json"
-        precomputed.save(output_file)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_precompute_one_intervention, yaml_file, output_dir, kwargs)
+            for yaml_file in yaml_files
+        ]
 
-        results.append(precomputed)
-        print(f"  Saved to {output_file}")
+        for yaml_file, future in zip(yaml_files, futures):
+            precomputed = future.result()
+            results.append(precomputed)
+            print(f"Processed {yaml_file.name} -> {output_dir / f'{precomputed.id}.json'}")
 
     return results
 
@@ -339,18 +395,17 @@ class ProfilePrecomputedIntervention:
 
     def to_json(self) -> str:
         """Export as JSON for TypeScript consumption."""
-        return json.dumps(asdict(self), indent=2)
+        return _dumps_json(asdict(self)).decode()
 
     def save(self, path: Path):
         """Save to JSON file."""
         path = Path(path)
-        path.write_text(self.to_json())
+        path.write_bytes(_dumps_json(asdict(self)))
 
     @classmethod
     def load(cls, path: Path) -> "ProfilePrecomputedIntervention":
         """Load from JSON file."""
-        path = Path(path)
-        data = json.loads(path.read_text())
+        data = _loads_json(path)
 
         results = {}
         for key, result_data in data["results"].items():
@@ -423,6 +478,7 @@ def precompute_intervention_profiles(
     random_seed: Optional[int] = 42,
     n_workers: Optional[int] = None,
     progress_callback=None,
+    executor: Optional[ProcessPoolExecutor] = None,
 ) -> ProfilePrecomputedIntervention:
     """
     Precompute QALY results for an intervention across all profile combinations.
@@ -439,8 +495,11 @@ def precompute_intervention_profiles(
         n_samples: Number of Monte Carlo samples per profile
         discount_rate: Annual discount rate
         random_seed: Random seed for reproducibility
-        n_workers: Number of parallel workers (default: CPU count)
+        n_workers: Number of parallel workers (default: CPU count);
+            ignored when an executor is supplied
         progress_callback: Optional callback(completed, total) for progress
+        executor: Optional already-running ProcessPoolExecutor to reuse,
+            so callers looping over interventions pay worker startup once
 
     Returns:
         ProfilePrecomputedIntervention with results for all profiles
@@ -492,17 +551,22 @@ def precompute_intervention_profiles(
         for profile in profiles
     ]
 
-    # Sequential execution (simpler, more reliable for now)
-    # TODO: Add parallel execution option
-    for i, (intervention, profile, n_samples, discount_rate, seed) in enumerate(work_items):
-        key, result = _simulate_single_profile(
-            (intervention, profile, n_samples, discount_rate, seed)
-        )
-        results[key] = result
-        all_qaly_gains.append(result.qaly_median)
+    # Each profile is an independent simulation with its own seed, so
+    # fan the grid out over a process pool; executor.map keeps outcomes
+    # in submission order for stable progress reporting
+    def _collect(outcomes):
+        for i, (key, result) in enumerate(outcomes, start=1):
+            results[key] = result
+            all_qaly_gains.append(result.qaly_median)
+
+            if progress_callback:
+                progress_callback(i, total_profiles)
 
-        if progress_callback:
-            progress_callback(i + 1, total_profiles)
+    if executor is not None:
+        _collect(executor.map(_simulate_single_profile, work_items, chunksize=8))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as own_executor:
+            _collect(own_executor.map(_simulate_single_profile, work_items, chunksize=8))
 
     # Summary statistics
     summary = {
@@ -558,52 +622,59 @@ def precompute_all_profiles(
     start_time = time.time()
     skipped = 0
 
-    for idx, yaml_file in enumerate(yaml_files):
-        intervention = Intervention.from_yaml(yaml_file)
-        output_file = output_dir / f"{intervention.id}_profiles.json"
-
-        # Resume: skip if output already exists and is recent
-        if resume and output_file.exists():
-            # Check if file was modified within the last hour (current run)
-            file_age = time.time() - output_file.stat().st_mtime
-            if file_age < 3600:  # Less than 1 hour old
-                print(f"[{idx + 1}/{total_interventions}] Skipping {yaml_file.name} (already computed)")
-                skipped += 1
-                continue
-
-        elapsed = time.time() - start_time
-        remaining_interventions = total_interventions - idx - skipped
-        if idx > skipped:
-            eta = elapsed / (idx - skipped) * remaining_interventions
-            eta_str = f", ETA: {eta/60:.0f}min"
-        else:
-            eta_str = ""
-
-        print(f"\n[{idx + 1}/{total_interventions}] Processing {yaml_file.name}{eta_str}")
-        sys.stdout.flush()
-
-        intervention_start = time.time()
-
-        def progress(completed, total):
-            pct = 100 * completed / total
-            intervention_elapsed = time.time() - intervention_start
-            if completed > 0:
-                profile_eta = intervention_elapsed / completed * (total - completed)
-                print(f"  Profile {completed}/{total} ({pct:.0f}%) [{intervention_elapsed:.0f}s elapsed, ~{profile_eta:.0f}s remaining]", end="\r")
+    # One pool for the whole run: worker processes (and their warm import
+    # state) are reused across interventions instead of respawned per file
+    executor = ProcessPoolExecutor(max_workers=kwargs.get("n_workers"))
+    try:
+        for idx, yaml_file in enumerate(yaml_files):
+            intervention = Intervention.from_yaml(yaml_file)
+            output_file = output_dir / f"{intervention.id}_profiles.json"
+
+            # Resume: skip if output already exists and is recent
+            if resume and output_file.exists():
+                # Check if file was modified within the last hour (current run)
+                file_age = time.time() - output_file.stat().st_mtime
+                if file_age < 3600:  # Less than 1 hour old
+                    print(f"[{idx + 1}/{total_interventions}] Skipping {yaml_file.name} (already computed)")
+                    skipped += 1
+                    continue
+
+            elapsed = time.time() - start_time
+            remaining_interventions = total_interventions - idx - skipped
+            if idx > skipped:
+                eta = elapsed / (idx - skipped) * remaining_interventions
+                eta_str = f", ETA: {eta/60:.0f}min"
+            else:
+                eta_str = ""
+
+            print(f"\n[{idx + 1}/{total_interventions}] Processing {yaml_file.name}{eta_str}")
             sys.stdout.flush()
 
-        precomputed = precompute_intervention_profiles(
-            intervention,
-            progress_callback=progress,
-            **kwargs
-        )
+            intervention_start = time.time()
+
+            def progress(completed, total):
+                pct = 100 * completed / total
+                intervention_elapsed = time.time() - intervention_start
+                if completed > 0:
+                    profile_eta = intervention_elapsed / completed * (total - completed)
+                    print(f"  Profile {completed}/{total} ({pct:.0f}%) [{intervention_elapsed:.0f}s elapsed, ~{profile_eta:.0f}s remaining]", end="\r")
+                sys.stdout.flush()
 
-        precomputed.save(output_file)
+            precomputed = precompute_intervention_profiles(
+                intervention,
+                progress_callback=progress,
+                executor=executor,
+                **kwargs
+            )
 
-        results.append(precomputed)
-        print(f"\n  Saved to {output_file}")
-        print(f"  QALY range: {precomputed.summary['qaly_min']:.3f} - {precomputed.summary['qaly_max']:.3f}")
-        sys.stdout.flush()
+            precomputed.save(output_file)
+
+            results.append(precomputed)
+            print(f"\n  Saved to {output_file}")
+            print(f"  QALY range: {precomputed.summary['qaly_min']:.3f} - {precomputed.summary['qaly_max']:.3f}")
+            sys.stdout.flush()
+    finally:
+        executor.shutdown()
 
     total_elapsed = time.time() - start_time
     print(f"\nCompleted {len(results)} interventions in {total_elapsed/60:.1f} minutes")
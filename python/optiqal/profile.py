@@ -5,11 +5,12 @@ Defines demographic profiles for precomputation with relative mortality adjustme
 """
 
 from dataclasses import dataclass
+from functools import cache
 from typing import Iterator, Literal, Optional
 import numpy as np
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Profile:
     """
     Demographic profile for QALY calculation.
@@ -105,10 +106,14 @@ ACTIVITY_MORTALITY_RR = {
 }
 
 
+@cache
 def get_baseline_mortality_multiplier(profile: Profile) -> float:
     """
     Calculate multiplicative adjustment to baseline mortality.
 
+    Cached: Profile is frozen/hashable and the precompute grid revisits
+    the same profiles many times.
+
     Combines relative risks from BMI, smoking, and physical activity level.
 
     NOTE: Diabetes and hypertension are NOT included here because they are
@@ -94,23 +94,33 @@ def simulate_qaly_profile_vectorized(
     # Sample HRs and causal fractions (n_simulations,)
     hr_samples = intervention.mortality.hazard_ratio.sample(n_simulations, random_state)
 
-    if intervention_effect_modifier != 1.0:
-        hr_samples = np.exp(np.log(hr_samples) * intervention_effect_modifier)
+    has_modifier = intervention_effect_modifier != 1.0
+    has_confounding = apply_confounding and intervention.confounding_prior is not None
 
-    if apply_confounding and intervention.confounding_prior is not None:
+    # Work on the log scale throughout:
+    # log(adjusted_hr) = causal_fraction * modifier * log(observed_hr)
+    # Skip the multiplies (and the all-ones causal_samples allocation) when
+    # neither adjustment applies - the common fast path.
+    log_hr = np.log(hr_samples)
+
+    if has_modifier:
+        log_hr = log_hr * intervention_effect_modifier
+
+    if has_confounding:
         causal_samples = intervention.confounding_prior.sample(n_simulations, random_state)
         causal_fraction_mean = intervention.confounding_prior.mean
         causal_fraction_ci = intervention.confounding_prior.ci(0.95)
+        log_hr = log_hr * causal_samples
     else:
-        causal_samples = np.ones(n_simulations)
         causal_fraction_mean = None
         causal_fraction_ci = None
 
-    # Adjust HRs for confounding: log(adjusted_hr) = causal_fraction * log(observed_hr)
-    adjusted_hrs = np.exp(causal_samples * np.log(hr_samples))  # (n_simulations,)
+    if has_modifier or has_confounding:
+        adjusted_hrs = np.exp(log_hr)  # (n_simulations,)
+    else:
+        adjusted_hrs = hr_samples
 
     # Pathway HRs: CVD gets 1.3x, cancer 0.8x, other 0.6x on log scale
-    log_hr = np.log(adjusted_hrs)  # (n_simulations,)
     pathway_hrs = np.stack([
         np.exp(log_hr * 1.3),  # CVD
         np.exp(log_hr * 0.8),  # Cancer
@@ -180,105 +190,112 @@ def simulate_qaly_profile_vectorized(
     )
 
 
-def simulate_qaly(
+def _sample_pathway_hrs(
     intervention: Intervention,
-    age: int,
-    sex: Literal["male", "female"],
-    n_simulations: int = 10000,
-    discount_rate: float = 0.03,
-    apply_confounding: bool = True,
-    random_state: Optional[int] = None,
-) -> SimulationResult:
+    n_simulations: int,
+    apply_confounding: bool,
+    random_state: Optional[int],
+) -> tuple:
     """
-    Run Monte Carlo simulation to estimate QALY impact.
-
-    Args:
-        intervention: Intervention to simulate
-        age: Starting age
-        sex: Biological sex for life table lookup
-        n_simulations: Number of Monte Carlo iterations
-        discount_rate: Annual discount rate (default 3%)
-        apply_confounding: Whether to apply confounding adjustment
-        random_state: Random seed for reproducibility
+    Sample HRs, apply confounding, and expand to pathway HRs.
 
     Returns:
-        SimulationResult with QALY estimates and uncertainty
+        (pathway_hrs, causal_fraction_mean, causal_fraction_ci) where
+        pathway_hrs has shape (n_simulations, 3) in cvd/cancer/other order
     """
-    rng = np.random.default_rng(random_state)
-
-    if intervention.mortality is None:
-        # No mortality effect, return zeros
-        return SimulationResult(
-            median=0,
-            mean=0,
-            std=0,
-            ci95=(0, 0),
-            ci50=(0, 0),
-            prob_positive=0.5,
-            prob_more_than_one_year=0,
-            cvd_contribution=0,
-            cancer_contribution=0,
-            other_contribution=0,
-            life_years_gained=0,
-            n_simulations=n_simulations,
-            discount_rate=discount_rate,
-        )
-
-    # Sample from distributions
     hr_samples = intervention.mortality.hazard_ratio.sample(n_simulations, random_state)
+    log_hr = np.log(hr_samples)
 
-    # Sample causal fractions if applying confounding
     if apply_confounding and intervention.confounding_prior is not None:
         causal_samples = intervention.confounding_prior.sample(n_simulations, random_state)
         causal_fraction_mean = intervention.confounding_prior.mean
         causal_fraction_ci = intervention.confounding_prior.ci(0.95)
+        log_hr = log_hr * causal_samples
     else:
-        causal_samples = np.ones(n_simulations)
         causal_fraction_mean = None
         causal_fraction_ci = None
 
-    # Run lifecycle calculations
-    qaly_gains = np.zeros(n_simulations)
-    life_years = np.zeros(n_simulations)
-    cvd_contributions = np.zeros(n_simulations)
-    cancer_contributions = np.zeros(n_simulations)
-    other_contributions = np.zeros(n_simulations)
+    # Pathway HRs: CVD gets 1.3x, cancer 0.8x, other 0.6x on log scale
+    pathway_hrs = np.exp(log_hr[:, None] * np.array([1.3, 0.8, 0.6]))  # (n_simulations, 3)
+    return pathway_hrs, causal_fraction_mean, causal_fraction_ci
 
-    lifecycle = LifecycleModel(
-        start_age=age,
-        sex=sex,
-        discount_rate=discount_rate,
-    )
 
-    # Base HR for pathway distribution
-    base_hr = intervention.mortality.hazard_ratio.mean
+def _simulate_cell(
+    pathway_hrs: np.ndarray,
+    age: int,
+    sex: Literal["male", "female"],
+    discount_rate: float,
+) -> tuple:
+    """
+    Survival-curve QALY integration for one age/sex cell.
 
-    for i in range(n_simulations):
-        # Sample HR and causal fraction
-        sampled_hr = hr_samples[i]
-        causal_fraction = causal_samples[i]
+    Returns:
+        (qaly_gains, life_years, contributions) arrays over simulations
+    """
+    n_simulations = pathway_hrs.shape[0]
 
-        # Adjust HR for confounding
-        adjusted_hr = adjust_hr(sampled_hr, causal_fraction)
+    # Pre-compute year arrays (static for all simulations)
+    max_age = 100
+    years = np.arange(max_age - age)
+    ages = age + years
 
-        # Convert to pathway HRs
-        log_hr = np.log(adjusted_hr)
-        pathway_hrs = PathwayHRs(
-            cvd=np.exp(log_hr * 1.3),  # CVD gets stronger effect
-            cancer=np.exp(log_hr * 0.8),
-            other=np.exp(log_hr * 0.6),
+    base_qx = np.array([get_mortality_rate(int(a), sex) for a in ages])
+    quality = np.array([get_quality_weight(int(a)) for a in ages])
+    discount = (1 / (1 + discount_rate)) ** years
+    cause_fracs = np.array(
+        [[get_cause_fraction(int(a))[k] for k in ("cvd", "cancer", "other")] for a in ages]
+    )  # (n_years, 3)
+
+    qd = quality * discount  # per-year QALY weight while alive
+
+    # Baseline survival and QALYs (deterministic, same for all simulations)
+    baseline_survival = np.concatenate([[1.0], np.cumprod(1 - base_qx)[:-1]])
+    baseline_qalys = np.sum(baseline_survival * qd)
+    baseline_life_years = np.sum(baseline_survival)
+
+    # Intervention mortality and survival curves (n_simulations, n_years)
+    intervention_qx = base_qx[None, :] * np.einsum("yk,sk->sy", cause_fracs, pathway_hrs)
+    intervention_qx = np.minimum(intervention_qx, 0.99)
+    intervention_survival = np.concatenate(
+        [np.ones((n_simulations, 1)), np.cumprod(1 - intervention_qx, axis=1)[:, :-1]],
+        axis=1,
+    )
+
+    intervention_qalys = intervention_survival @ qd  # (n_simulations,)
+    intervention_life_years = np.sum(intervention_survival, axis=1)
+
+    qaly_gains = intervention_qalys - baseline_qalys
+    life_years = intervention_life_years - baseline_life_years
+
+    # Pathway contributions: attribute each year's QALY gain proportionally
+    # to the mortality reduction on each pathway (same rule as
+    # LifecycleModel.calculate, applied over the whole grid at once)
+    qaly_diff = np.maximum(
+        (intervention_survival - baseline_survival[None, :]) * qd[None, :], 0.0
+    )  # (n_simulations, n_years)
+    reduction = cause_fracs[None, :, :] * (1 - pathway_hrs[:, None, :])  # (s, y, 3)
+    total_reduction = np.sum(reduction, axis=2)  # (s, y)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        share = np.where(
+            total_reduction[:, :, None] > 0,
+            reduction / np.where(total_reduction == 0, 1.0, total_reduction)[:, :, None],
+            0.0,
         )
+    contributions = np.einsum("sy,syk->sk", qaly_diff, share)  # (n_simulations, 3)
 
-        # Run lifecycle calculation
-        result = lifecycle.calculate(pathway_hrs)
+    return qaly_gains, life_years, contributions
 
-        qaly_gains[i] = result.qaly_gain
-        life_years[i] = result.life_years_gained
-        cvd_contributions[i] = result.pathway_contributions["cvd"]
-        cancer_contributions[i] = result.pathway_contributions["cancer"]
-        other_contributions[i] = result.pathway_contributions["other"]
 
-    # Calculate statistics
+def _summarize_cell(
+    qaly_gains: np.ndarray,
+    life_years: np.ndarray,
+    contributions: np.ndarray,
+    causal_fraction_mean: Optional[float],
+    causal_fraction_ci: Optional[tuple],
+    n_simulations: int,
+    discount_rate: float,
+) -> SimulationResult:
+    """Reduce per-simulation arrays to a SimulationResult."""
     return SimulationResult(
         median=float(np.median(qaly_gains)),
         mean=float(np.mean(qaly_gains)),
@@ -287,9 +304,9 @@ def simulate_qaly(
         ci50=(float(np.percentile(qaly_gains, 25)), float(np.percentile(qaly_gains, 75))),
         prob_positive=float(np.mean(qaly_gains > 0)),
         prob_more_than_one_year=float(np.mean(qaly_gains > 1)),
-        cvd_contribution=float(np.median(cvd_contributions)),
-        cancer_contribution=float(np.median(cancer_contributions)),
-        other_contribution=float(np.median(other_contributions)),
+        cvd_contribution=float(np.median(contributions[:, 0])),
+        cancer_contribution=float(np.median(contributions[:, 1])),
+        other_contribution=float(np.median(contributions[:, 2])),
         life_years_gained=float(np.median(life_years)),
         causal_fraction_mean=causal_fraction_mean,
         causal_fraction_ci=causal_fraction_ci,
@@ -298,6 +315,140 @@ def simulate_qaly(
     )
 
 
+def simulate_qaly_vectorized(
+    intervention: Intervention,
+    age: int,
+    sex: Literal["male", "female"],
+    n_simulations: int = 10000,
+    discount_rate: float = 0.03,
+    apply_confounding: bool = True,
+    random_state: Optional[int] = None,
+) -> SimulationResult:
+    """
+    Fused, vectorized equivalent of simulate_qaly.
+
+    Fuses HR sampling, confounding adjustment, pathway HR application, and
+    survival-curve QALY integration into one set of whole-array NumPy ops,
+    instead of one LifecycleModel.calculate call per sample. Used by
+    precompute, where the per-sample Python loop dominates runtime.
+    """
+    if intervention.mortality is None:
+        return SimulationResult(
+            median=0, mean=0, std=0, ci95=(0, 0), ci50=(0, 0),
+            prob_positive=0.5, prob_more_than_one_year=0,
+            cvd_contribution=0, cancer_contribution=0, other_contribution=0,
+            life_years_gained=0, n_simulations=n_simulations, discount_rate=discount_rate,
+        )
+
+    pathway_hrs, causal_fraction_mean, causal_fraction_ci = _sample_pathway_hrs(
+        intervention, n_simulations, apply_confounding, random_state
+    )
+    qaly_gains, life_years, contributions = _simulate_cell(
+        pathway_hrs, age, sex, discount_rate
+    )
+    return _summarize_cell(
+        qaly_gains, life_years, contributions,
+        causal_fraction_mean, causal_fraction_ci,
+        n_simulations, discount_rate,
+    )
+
+
+def simulate_qaly_grid(
+    intervention: Intervention,
+    ages: list,
+    sexes: list,
+    n_simulations: int = 10000,
+    discount_rate: float = 0.03,
+    apply_confounding: bool = True,
+    random_state: Optional[int] = None,
+) -> dict:
+    """
+    Simulate one intervention over an age x sex grid in a single batch.
+
+    Samples HRs and confounding once and reuses the draws for every
+    demographic cell, so a sweep pays the sampling cost once and the
+    cells are perfectly correlated (differences between cells reflect
+    demographics, not sampling noise). Each cell's result is identical
+    to simulate_qaly_vectorized with the same seed.
+
+    Args:
+        intervention: Intervention to simulate
+        ages: Starting ages (grid axis)
+        sexes: Biological sexes (grid axis)
+        n_simulations: Number of Monte Carlo iterations per cell
+        discount_rate: Annual discount rate (default 3%)
+        apply_confounding: Whether to apply confounding adjustment
+        random_state: Random seed for reproducibility
+
+    Returns:
+        Dict mapping "age_sex" keys (e.g. "40_male") to SimulationResult
+    """
+    if intervention.mortality is None:
+        null_result = SimulationResult(
+            median=0, mean=0, std=0, ci95=(0, 0), ci50=(0, 0),
+            prob_positive=0.5, prob_more_than_one_year=0,
+            cvd_contribution=0, cancer_contribution=0, other_contribution=0,
+            life_years_gained=0, n_simulations=n_simulations, discount_rate=discount_rate,
+        )
+        return {f"{age}_{sex}": null_result for age in ages for sex in sexes}
+
+    pathway_hrs, causal_fraction_mean, causal_fraction_ci = _sample_pathway_hrs(
+        intervention, n_simulations, apply_confounding, random_state
+    )
+
+    results = {}
+    for age in ages:
+        for sex in sexes:
+            qaly_gains, life_years, contributions = _simulate_cell(
+                pathway_hrs, age, sex, discount_rate
+            )
+            results[f"{age}_{sex}"] = _summarize_cell(
+                qaly_gains, life_years, contributions,
+                causal_fraction_mean, causal_fraction_ci,
+                n_simulations, discount_rate,
+            )
+    return results
+
+
+def simulate_qaly(
+    intervention: Intervention,
+    age: int,
+    sex: Literal["male", "female"],
+    n_simulations: int = 10000,
+    discount_rate: float = 0.03,
+    apply_confounding: bool = True,
+    random_state: Optional[int] = None,
+) -> SimulationResult:
+    """
+    Run Monte Carlo simulation to estimate QALY impact.
+
+    Args:
+        intervention: Intervention to simulate
+        age: Starting age
+        sex: Biological sex for life table lookup
+        n_simulations: Number of Monte Carlo iterations
+        discount_rate: Annual discount rate (default 3%)
+        apply_confounding: Whether to apply confounding adjustment
+        random_state: Random seed for reproducibility
+
+    Returns:
+        SimulationResult with QALY estimates and uncertainty
+
+    Delegates to simulate_qaly_vectorized, which applies the same
+    sampling, confounding adjustment, and pathway attribution as whole-
+    array operations instead of one LifecycleModel.calculate per sample.
+    """
+    return simulate_qaly_vectorized(
+        intervention,
+        age=age,
+        sex=sex,
+        n_simulations=n_simulations,
+        discount_rate=discount_rate,
+        apply_confounding=apply_confounding,
+        random_state=random_state,
+    )
+
+
 def simulate_qaly_profile(
     intervention: Intervention,
     profile: Profile,
@@ -11,7 +11,7 @@ class TestDistribution:
         dist = Distribution(type="point", params={"value": 0.85})
         assert dist.mean == 0.85
         samples = dist.sample(100)
-        assert all(s == 0.85 for s in samples)
+        assert (samples == 0.85).all()
 
     def test_normal_distribution(self):
         dist = Distribution(type="normal", params={"mean": 0, "sd": 1})
@@ -23,7 +23,7 @@ class TestDistribution:
     def test_lognormal_distribution(self):
         dist = Distribution(type="lognormal", params={"log_mean": -0.2, "log_sd": 0.1})
         samples = dist.sample(10000, random_state=42)
-        assert all(s > 0 for s in samples)
+        assert (samples > 0).all()
         # Mean of lognormal: exp(mu + sigma^2/2)
         expected_mean = np.exp(-0.2 + 0.1**2 / 2)
         assert abs(dist.mean - expected_mean) < 0.01
@@ -31,13 +31,13 @@ class TestDistribution:
     def test_beta_distribution(self):
         dist = Distribution(type="beta", params={"alpha": 2, "beta": 5})
         samples = dist.sample(10000, random_state=42)
-        assert all(0 <= s <= 1 for s in samples)
+        assert ((samples >= 0) & (samples <= 1)).all()
         assert abs(dist.mean - 2/7) < 0.01
 
     def test_uniform_distribution(self):
         dist = Distribution(type="uniform", params={"min": 0.7, "max": 0.9})
         samples = dist.sample(10000, random_state=42)
-        assert all(0.7 <= s <= 0.9 for s in samples)
+        assert ((samples >= 0.7) & (samples <= 0.9)).all()
         assert abs(dist.mean - 0.8) < 0.01
 
 
@@ -61,10 +61,7 @@ class TestDistributionShorthand:
         assert dist.params["beta"] == 5.0
 
 
-class TestInterventionFromDict:
-    @pytest.fixture
-    def walking_yaml(self):
-        return """
+WALKING_YAML = """
 id: walking_30min
 name: Walking 30 minutes daily
 category: exercise
@@ -90,23 +87,28 @@ caveats:
   - Healthy user bias possible
 """
 
-    def test_load_from_yaml_string(self, walking_yaml):
-        intervention = Intervention.from_yaml_string(walking_yaml)
-        assert intervention.id == "walking_30min"
-        assert intervention.name == "Walking 30 minutes daily"
-        assert intervention.category == "exercise"
 
-    def test_mortality_effect_parsed(self, walking_yaml):
-        intervention = Intervention.from_yaml_string(walking_yaml)
-        assert intervention.mortality is not None
-        assert intervention.mortality.hazard_ratio.type == "lognormal"
-        assert intervention.mortality.hazard_ratio.mean < 1  # Protective
+@pytest.fixture(scope="module")
+def walking_intervention():
+    """Parsed walking intervention, shared across tests (parsing is pure)."""
+    return Intervention.from_yaml_string(WALKING_YAML)
+
+
+class TestInterventionFromDict:
+    def test_load_from_yaml_string(self, walking_intervention):
+        assert walking_intervention.id == "walking_30min"
+        assert walking_intervention.name == "Walking 30 minutes daily"
+        assert walking_intervention.category == "exercise"
+
+    def test_mortality_effect_parsed(self, walking_intervention):
+        assert walking_intervention.mortality is not None
+        assert walking_intervention.mortality.hazard_ratio.type == "lognormal"
+        assert walking_intervention.mortality.hazard_ratio.mean < 1  # Protective
 
-    def test_confounding_prior_assigned(self, walking_yaml):
-        intervention = Intervention.from_yaml_string(walking_yaml)
+    def test_confounding_prior_assigned(self, walking_intervention):
         # Should get exercise category prior
-        assert intervention.confounding_prior is not None
-        assert intervention.confounding_prior.mean < 0.5  # Skeptical
+        assert walking_intervention.confounding_prior is not None
+        assert walking_intervention.confounding_prior.mean < 0.5  # Skeptical
 
 
 class TestInterventionPathwayHRs:
@@ -148,3 +150,21 @@ class TestInterventionPathwayHRs:
 
         # Partial causation should show weaker effect
         assert partial["cvd"] > full["cvd"]
+
+    def test_batch_matches_scalar(self):
+        hr_dist = Distribution(type="point", params={"value": 0.8})
+        intervention = Intervention(
+            id="test",
+            name="Test",
+            category="exercise",
+            mortality=MortalityEffect(hazard_ratio=hr_dist),
+        )
+        causal_fractions = np.array([1.0, 0.5])
+        hr_samples = np.full(2, 0.8)
+
+        batch = intervention.to_pathway_hrs_batch(causal_fractions, hr_samples)
+
+        for i, cf in enumerate(causal_fractions):
+            scalar = intervention.to_pathway_hrs(causal_fraction=cf)
+            for pathway in ("cvd", "cancer", "other"):
+                assert batch[pathway][i] == pytest.approx(scalar[pathway])
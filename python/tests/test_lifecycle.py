@@ -52,8 +52,10 @@ class TestQualityWeights:
 
 
 class TestLifecycleModel:
-    @pytest.fixture
-    def model(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def model():
+        """Shared across the class; tests only read from the model."""
         return LifecycleModel(start_age=40, sex="male")
 
     def test_no_effect_with_hr_one(self, model):
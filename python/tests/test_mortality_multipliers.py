@@ -13,10 +13,10 @@ The precompute script passes:
 import pytest
 import numpy as np
 from optiqal.profile import Profile, get_baseline_mortality_multiplier
-from optiqal.markov import HealthState, simulate_lifetime_markov
+from optiqal.markov import HealthState, life_expectancy_exact, simulate_lifetime_markov_batch
 
 
-def simulate_life_expectancy(profile: Profile, n_sims: int = 200, seed: int = 42) -> float:
+def simulate_life_expectancy(profile: Profile, n_sims: int = 2000, seed: int = 42) -> float:
     """Helper to get median death age for a profile."""
     rng = np.random.default_rng(seed)
 
@@ -26,18 +26,25 @@ def simulate_life_expectancy(profile: Profile, n_sims: int = 200, seed: int = 42
         hypertension=profile.has_hypertension,
     )
 
-    life_years = []
-    for _ in range(n_sims):
-        result = simulate_lifetime_markov(
-            start_age=profile.age,
-            sex=profile.sex,
-            intervention_hr=mortality_multiplier,
-            initial_state=initial_state,
-            rng=rng,
-        )
-        life_years.append(result.life_years)
+    _, life_years = simulate_lifetime_markov_batch(
+        start_age=profile.age,
+        sex=profile.sex,
+        n_samples=n_sims,
+        intervention_hr=mortality_multiplier,
+        initial_state=initial_state,
+        rng=rng,
+        antithetic=True,
+    )
+
+    # O(n) selection of the median instead of a full sort
+    mid = n_sims // 2
+    if n_sims % 2:
+        median = np.partition(life_years, mid)[mid]
+    else:
+        part = np.partition(life_years, [mid - 1, mid])
+        median = (part[mid - 1] + part[mid]) / 2
 
-    return profile.age + np.median(life_years)
+    return profile.age + median
 
 
 class TestMortalityMultiplierArchitecture:
@@ -157,9 +164,11 @@ class TestLifeExpectancyReasonableness:
             ("healthy", Profile(35, "male", "normal", "never", False, False, "moderate")),
         ]
 
+        # Ordering needs only the central estimate, so the exact
+        # (deterministic) expectation replaces Monte Carlo here
         death_ages = {}
         for name, profile in profiles:
-            death_ages[name] = simulate_life_expectancy(profile)
+            death_ages[name] = life_expectancy_exact(profile)
 
         assert death_ages["healthy"] > death_ages["average"], (
             f"Healthy ({death_ages['healthy']:.0f}) should outlive "
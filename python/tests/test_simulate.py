@@ -5,10 +5,15 @@ import numpy as np
 
 from optiqal.intervention import Distribution, Intervention, MortalityEffect
 from optiqal.confounding import ConfoundingPrior
-from optiqal.simulate import simulate_qaly, SimulationResult
+from optiqal.simulate import (
+    simulate_qaly,
+    simulate_qaly_grid,
+    simulate_qaly_vectorized,
+    SimulationResult,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def protective_intervention():
     """Intervention with protective mortality effect."""
     return Intervention(
@@ -25,7 +30,7 @@ def protective_intervention():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def null_intervention():
     """Intervention with no mortality effect."""
     return Intervention(
@@ -36,37 +41,32 @@ def null_intervention():
     )
 
 
-class TestSimulateQALY:
-    def test_returns_simulation_result(self, protective_intervention):
-        result = simulate_qaly(
-            protective_intervention,
-            age=40,
-            sex="male",
-            n_simulations=1000,
-            random_state=42,
-        )
-        assert isinstance(result, SimulationResult)
+@pytest.fixture(scope="module")
+def protective_result(protective_intervention):
+    """Canonical simulation shared by the read-only assertions."""
+    return simulate_qaly(
+        protective_intervention,
+        age=40,
+        sex="male",
+        n_simulations=1000,
+        random_state=42,
+    )
 
-    def test_positive_qaly_gain(self, protective_intervention):
-        result = simulate_qaly(
-            protective_intervention,
-            age=40,
-            sex="male",
-            n_simulations=1000,
-            random_state=42,
-        )
-        assert result.median > 0
-        assert result.mean > 0
 
-    def test_confidence_interval_contains_median(self, protective_intervention):
-        result = simulate_qaly(
-            protective_intervention,
-            age=40,
-            sex="male",
-            n_simulations=1000,
-            random_state=42,
+class TestSimulateQALY:
+    def test_returns_simulation_result(self, protective_result):
+        assert isinstance(protective_result, SimulationResult)
+
+    def test_positive_qaly_gain(self, protective_result):
+        assert protective_result.median > 0
+        assert protective_result.mean > 0
+
+    def test_confidence_interval_contains_median(self, protective_result):
+        assert (
+            protective_result.ci95[0]
+            < protective_result.median
+            < protective_result.ci95[1]
         )
-        assert result.ci95[0] < result.median < result.ci95[1]
 
     def test_null_intervention_zero_gain(self, null_intervention):
         result = simulate_qaly(
@@ -78,17 +78,14 @@ class TestSimulateQALY:
         assert result.median == 0
         assert result.mean == 0
 
-    def test_pathway_contributions_sum(self, protective_intervention):
-        result = simulate_qaly(
-            protective_intervention,
-            age=40,
-            sex="male",
-            n_simulations=1000,
-            random_state=42,
+    def test_pathway_contributions_sum(self, protective_result):
+        total = (
+            protective_result.cvd_contribution
+            + protective_result.cancer_contribution
+            + protective_result.other_contribution
         )
-        total = result.cvd_contribution + result.cancer_contribution + result.other_contribution
         # Allow some tolerance
-        assert abs(total - result.median) < 0.5
+        assert abs(total - protective_result.median) < 0.5
 
     def test_confounding_reduces_effect(self, protective_intervention):
         with_confounding = simulate_qaly(
@@ -128,17 +125,29 @@ class TestSimulateQALY:
         # Younger person has more years to benefit
         assert young.life_years_gained > old.life_years_gained
 
-    def test_prob_positive(self, protective_intervention):
-        result = simulate_qaly(
+    def test_prob_positive(self, protective_result):
+        assert 0 <= protective_result.prob_positive <= 1
+        # Should be high for protective intervention
+        assert protective_result.prob_positive > 0.9
+
+    def test_grid_matches_single_cell(self, protective_intervention):
+        grid = simulate_qaly_grid(
             protective_intervention,
-            age=40,
-            sex="male",
-            n_simulations=1000,
+            ages=[40, 60],
+            sexes=["male", "female"],
+            n_simulations=500,
             random_state=42,
         )
-        assert 0 <= result.prob_positive <= 1
-        # Should be high for protective intervention
-        assert result.prob_positive > 0.9
+        single = simulate_qaly_vectorized(
+            protective_intervention,
+            age=60,
+            sex="female",
+            n_simulations=500,
+            random_state=42,
+        )
+        assert set(grid) == {"40_male", "40_female", "60_male", "60_female"}
+        assert grid["60_female"].median == single.median
+        assert grid["60_female"].ci95 == single.ci95
 
     def test_discounting_effect(self, protective_intervention):
         discounted = simulate_qaly(
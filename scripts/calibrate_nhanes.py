@@ -25,9 +25,11 @@ Usage:
     python scripts/calibrate_nhanes.py
 """
 
+import hashlib
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.request import urlretrieve
@@ -35,6 +37,18 @@ from urllib.request import urlretrieve
 import numpy as np
 import pandas as pd
 
+try:
+    import pyreadstat
+    HAS_PYREADSTAT = True
+except ImportError:
+    HAS_PYREADSTAT = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -102,6 +116,33 @@ HAZARD_RATIOS = {
     },
 }
 
+# Bin edges and labels for vectorized classification via np.searchsorted.
+# Boundaries mirror the scalar classify_* rules with side="right": strict
+# upper bounds for BMI and exercise; the 9h sleep bound is inclusive, so
+# its edge is the next float above 9.
+BMI_EDGES = np.array([18.5, 25.0, 30.0, 35.0, 40.0])
+BMI_LABELS = np.array(
+    ["underweight", "normal", "overweight", "obese1", "obese2", "obese3"]
+)
+EXERCISE_EDGES = np.array([2.5, 5.0, 7.5])
+EXERCISE_LABELS = np.array(["low", "recommended", "high", "veryHigh"])
+SLEEP_EDGES = np.array([6.0, np.nextafter(9.0, np.inf)])
+SLEEP_LABELS = np.array(["short", "normal", "long"])
+
+# Columns actually consumed from each NHANES component. Names that vary
+# by cycle (weight, sleep) list every variant; missing ones are dropped
+# per file before the projected read.
+XPT_COLUMNS = {
+    "DEMO": ["SEQN", "RIDAGEYR", "RIAGENDR", "WTMEC2YR", "WTMECPRP"],
+    "BMX": ["SEQN", "BMXBMI"],
+    "SMQ": ["SEQN", "SMQ020", "SMQ040"],
+    "PAQ": ["SEQN", "PAQ605", "PAQ610", "PAD615", "PAQ620", "PAQ625", "PAD630",
+            "PAQ650", "PAQ655", "PAD660", "PAQ665", "PAQ670", "PAD675"],
+    "SLQ": ["SEQN", "SLD012", "SLD010H"],
+    "DIQ": ["SEQN", "DIQ010"],
+    "BPQ": ["SEQN", "BPQ020"],
+}
+
 # Age groups for calibration
 AGE_GROUPS = [
     (18, 24),
@@ -123,12 +164,16 @@ def download_nhanes_files() -> Dict[str, Path]:
     """
     Download NHANES XPT files if not already cached.
 
+    Uncached files are fetched concurrently - the transfers are
+    latency-bound, so threads overlap the round trips.
+
     Returns:
         Dictionary mapping file names to local paths
     """
     RAW_DIR.mkdir(parents=True, exist_ok=True)
 
     file_paths = {}
+    to_download = []
     for name, url in NHANES_FILES.items():
         local_path = RAW_DIR / f"{name}.XPT"
         file_paths[name] = local_path
@@ -137,18 +182,84 @@ def download_nhanes_files() -> Dict[str, Path]:
             print(f"  [cached] {name}")
         else:
             print(f"  [downloading] {name}...")
-            try:
-                urlretrieve(url, local_path)
-                print(f"    -> {local_path.name}")
-            except Exception as e:
-                print(f"    ERROR: {e}")
-                # Remove partial file if download failed
-                if local_path.exists():
-                    local_path.unlink()
+            to_download.append((name, url, local_path))
+
+    if to_download:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(urlretrieve, url, local_path): (name, local_path)
+                for name, url, local_path in to_download
+            }
+            for future in as_completed(futures):
+                name, local_path = futures[future]
+                try:
+                    future.result()
+                    print(f"    -> {local_path.name}")
+                except Exception as e:
+                    print(f"    ERROR ({name}): {e}")
+                    # Remove partial file if download failed
+                    if local_path.exists():
+                        local_path.unlink()
 
     return file_paths
 
 
+def _downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast float64 columns to float32 (except the SEQN merge key).
+
+    NHANES columns encode small integer codes or modest-range measures,
+    all exactly representable in float32; halving the row width speeds
+    every merge, searchsorted, and groupby pass downstream. Small codes
+    stay exact, so == comparisons against 1/2/77/9999 are unaffected.
+    """
+    for col in df.columns:
+        if col != "SEQN" and df[col].dtype == np.float64:
+            df[col] = df[col].astype(np.float32)
+    return df
+
+
+def _read_xpt(path: Path, usecols: Optional[List[str]]) -> pd.DataFrame:
+    """
+    Parse an XPT file, projecting to the needed columns when possible.
+
+    pyreadstat reads only the requested columns from the transport
+    stream; pd.read_sas loads everything and is the fallback.
+    """
+    if HAS_PYREADSTAT and usecols is not None:
+        try:
+            _, meta = pyreadstat.read_xport(str(path), metadataonly=True)
+            present = [c for c in usecols if c in set(meta.column_names)]
+            df, _ = pyreadstat.read_xport(str(path), usecols=present)
+            return df
+        except Exception:
+            pass  # unexpected layout; fall back to the full parse
+    return pd.read_sas(path)
+
+
+def _read_cached(path: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read an NHANES XPT file, caching the parse as Parquet alongside it.
+
+    SAS XPT is a slow record-oriented format; reruns read the columnar
+    cache instead of re-parsing. Falls back to a plain read_sas when no
+    Parquet engine is available.
+    """
+    cache_path = path.with_suffix(".parquet")
+    if cache_path.exists():
+        try:
+            return _downcast_floats(pd.read_parquet(cache_path))
+        except Exception:
+            pass  # unreadable/stale cache; re-parse the XPT below
+
+    df = _downcast_floats(_read_xpt(path, usecols))
+    try:
+        df.to_parquet(cache_path, compression="zstd")
+    except Exception:
+        pass  # no Parquet engine; keep parsing the XPT each run
+    return df
+
+
 def load_and_merge_cycle(
     demo_file: Path,
     bmx_file: Path,
@@ -172,7 +283,7 @@ def load_and_merge_cycle(
     print(f"  Loading {cycle_name}...")
 
     # Load demographics (main file with weights)
-    demo = pd.read_sas(demo_file)
+    demo = _read_cached(demo_file, XPT_COLUMNS["DEMO"])
 
     # Select relevant columns
     # RIDAGEYR: Age in years
@@ -184,18 +295,18 @@ def load_and_merge_cycle(
     demo = demo.rename(columns={weight_col: "weight"})
 
     # Load body measures (BMI)
-    bmx = pd.read_sas(bmx_file)
+    bmx = _read_cached(bmx_file, XPT_COLUMNS["BMX"])
     # BMXBMI: Body Mass Index
     bmx = bmx[["SEQN", "BMXBMI"]].copy()
 
     # Load smoking questionnaire
-    smq = pd.read_sas(smq_file)
+    smq = _read_cached(smq_file, XPT_COLUMNS["SMQ"])
     # SMQ020: Ever smoked 100+ cigarettes (1=Yes, 2=No)
     # SMQ040: Current smoking (1=Every day, 2=Some days, 3=Not at all)
     smq = smq[["SEQN", "SMQ020", "SMQ040"]].copy()
 
     # Load physical activity
-    paq = pd.read_sas(paq_file)
+    paq = _read_cached(paq_file, XPT_COLUMNS["PAQ"])
     # PAQ605: Vigorous work activity (1=Yes, 2=No)
     # PAQ610: Days vigorous work per week
     # PAD615: Minutes vigorous work per day
@@ -216,7 +327,7 @@ def load_and_merge_cycle(
     paq = paq[paq_cols].copy()
 
     # Load sleep
-    slq = pd.read_sas(slq_file)
+    slq = _read_cached(slq_file, XPT_COLUMNS["SLQ"])
     # SLD012: Hours of sleep (weekdays/work days) or SLD010H
     sleep_col = "SLD012" if "SLD012" in slq.columns else "SLD010H"
     if sleep_col in slq.columns:
@@ -227,12 +338,12 @@ def load_and_merge_cycle(
         slq["sleep_hours"] = np.nan
 
     # Load diabetes
-    diq = pd.read_sas(diq_file)
+    diq = _read_cached(diq_file, XPT_COLUMNS["DIQ"])
     # DIQ010: Doctor told you have diabetes (1=Yes, 2=No, 3=Borderline)
     diq = diq[["SEQN", "DIQ010"]].copy()
 
     # Load blood pressure
-    bpq = pd.read_sas(bpq_file)
+    bpq = _read_cached(bpq_file, XPT_COLUMNS["BPQ"])
     # BPQ020: Told have high blood pressure (1=Yes, 2=No)
     bpq = bpq[["SEQN", "BPQ020"]].copy()
 
@@ -254,154 +365,71 @@ def load_and_merge_cycle(
 # Data Processing Functions
 # =============================================================================
 
-def compute_exercise_hours_per_week(row: pd.Series) -> float:
+def compute_exercise_hours_per_week(df: pd.DataFrame) -> np.ndarray:
     """
     Compute total exercise hours per week from NHANES physical activity data.
 
     Combines vigorous work, moderate work, vigorous recreation, and moderate recreation.
     Vigorous activity is counted at 2x intensity (per MET equivalents).
 
+    Operates column-wise on the full frame rather than per row - the per-row
+    version spent nearly all its time in Python-level row.get/pd.isna calls.
+
     Returns:
-        Hours of moderate-equivalent exercise per week
+        Array of moderate-equivalent exercise hours per week, one per row
     """
-    total_minutes = 0.0
-
-    # Helper to safely get value
-    def safe_get(col, default=0):
-        if col not in row.index:
-            return default
-        val = row[col]
-        if pd.isna(val) or val in [77, 99, 7777, 9999]:  # NHANES missing/refused codes
-            return default
-        return val
-
-    # Vigorous work activity (counted as 2x)
-    if safe_get("PAQ605") == 1:  # Yes, does vigorous work
-        days = safe_get("PAQ610")
-        mins = safe_get("PAD615")
-        total_minutes += days * mins * 2  # 2x for vigorous
-
-    # Moderate work activity
-    if safe_get("PAQ620") == 1:  # Yes, does moderate work
-        days = safe_get("PAQ625")
-        mins = safe_get("PAD630")
-        total_minutes += days * mins
-
-    # Vigorous recreational activity (counted as 2x)
-    if safe_get("PAQ650") == 1:  # Yes, does vigorous recreation
-        days = safe_get("PAQ655")
-        mins = safe_get("PAD660")
-        total_minutes += days * mins * 2  # 2x for vigorous
-
-    # Moderate recreational activity
-    if safe_get("PAQ665") == 1:  # Yes, does moderate recreation
-        days = safe_get("PAQ670")
-        mins = safe_get("PAD675")
-        total_minutes += days * mins
+
+    # Helper to safely get a cleaned column
+    def col(name: str) -> np.ndarray:
+        if name not in df.columns:
+            return np.zeros(len(df))
+        arr = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        # NHANES missing/refused codes
+        bad = np.isnan(arr) | np.isin(arr, (77.0, 99.0, 7777.0, 9999.0))
+        return np.where(bad, 0.0, arr)
+
+    total_minutes = (
+        # Vigorous work and recreation count as 2x
+        2.0 * (col("PAQ605") == 1) * col("PAQ610") * col("PAD615")
+        + (col("PAQ620") == 1) * col("PAQ625") * col("PAD630")
+        + 2.0 * (col("PAQ650") == 1) * col("PAQ655") * col("PAD660")
+        + (col("PAQ665") == 1) * col("PAQ670") * col("PAD675")
+    )
 
     return total_minutes / 60.0  # Convert to hours
 
 
-def classify_bmi(bmi: float) -> str:
-    """Classify BMI into categories matching TypeScript code."""
-    if pd.isna(bmi):
-        return "normal"  # Default assumption
-    if bmi < 18.5:
-        return "underweight"
-    if bmi < 25:
-        return "normal"
-    if bmi < 30:
-        return "overweight"
-    if bmi < 35:
-        return "obese1"
-    if bmi < 40:
-        return "obese2"
-    return "obese3"
-
-
-def classify_exercise(hours_per_week: float) -> str:
-    """Classify exercise level matching TypeScript code."""
-    if pd.isna(hours_per_week) or hours_per_week == 0:
-        return "none"
-    if hours_per_week < 2.5:
-        return "low"
-    if hours_per_week < 5:
-        return "recommended"
-    if hours_per_week < 7.5:
-        return "high"
-    return "veryHigh"
-
-
-def classify_sleep(hours_per_night: float) -> str:
-    """Classify sleep duration matching TypeScript code."""
-    if pd.isna(hours_per_night):
-        return "normal"  # Default assumption
-    if hours_per_night < 6:
-        return "short"
-    if hours_per_night <= 9:
-        return "normal"
-    return "long"
-
-
-def is_current_smoker(smq020: float, smq040: float) -> bool:
+def compute_individual_hr(df: pd.DataFrame) -> np.ndarray:
     """
-    Determine if currently smoking.
-
-    SMQ020=1 (smoked 100+ cigarettes) AND SMQ040 in [1, 2] (every day or some days)
-    """
-    if pd.isna(smq020) or smq020 != 1:
-        return False
-    if pd.isna(smq040):
-        return False
-    return smq040 in [1, 2]
-
-
-def has_diabetes(diq010: float) -> bool:
-    """DIQ010=1 means told by doctor have diabetes."""
-    return not pd.isna(diq010) and diq010 == 1
-
-
-def has_hypertension(bpq020: float) -> bool:
-    """BPQ020=1 means told by doctor have high blood pressure."""
-    return not pd.isna(bpq020) and bpq020 == 1
+    Compute combined hazard ratios from the risk factor category columns.
 
-
-def compute_individual_hr(row: pd.Series) -> float:
-    """
-    Compute combined hazard ratio for an individual based on their risk factors.
+    One dict-backed map per categorical factor plus np.where for the binary
+    factors, multiplied elementwise - no per-row Python calls.
 
     Returns:
-        Multiplicative combined HR
+        Array of multiplicative combined HRs, one per row
     """
-    hr = 1.0
-
-    # BMI
-    bmi_cat = classify_bmi(row.get("BMXBMI"))
-    hr *= HAZARD_RATIOS["bmi"][bmi_cat]
-
-    # Exercise
-    exercise_hours = row.get("exercise_hours", 0)
-    exercise_cat = classify_exercise(exercise_hours)
-    hr *= HAZARD_RATIOS["exercise"][exercise_cat]
-
-    # Sleep
-    sleep_hours = row.get("sleep_hours")
-    sleep_cat = classify_sleep(sleep_hours)
-    hr *= HAZARD_RATIOS["sleep"][sleep_cat]
-
-    # Smoking
-    smoker = is_current_smoker(row.get("SMQ020"), row.get("SMQ040"))
-    hr *= HAZARD_RATIOS["smoking"]["yes" if smoker else "no"]
-
-    # Diabetes
-    diabetes = has_diabetes(row.get("DIQ010"))
-    hr *= HAZARD_RATIOS["diabetes"]["yes" if diabetes else "no"]
-
-    # Hypertension
-    hypertension = has_hypertension(row.get("BPQ020"))
-    hr *= HAZARD_RATIOS["hypertension"]["yes" if hypertension else "no"]
+    bmi_hr = df["bmi_category"].map(HAZARD_RATIOS["bmi"]).to_numpy()
+    exercise_hr = df["exercise_category"].map(HAZARD_RATIOS["exercise"]).to_numpy()
+    sleep_hr = df["sleep_category"].map(HAZARD_RATIOS["sleep"]).to_numpy()
+
+    smoking_hr = np.where(
+        df["is_smoker"].to_numpy(),
+        HAZARD_RATIOS["smoking"]["yes"],
+        HAZARD_RATIOS["smoking"]["no"],
+    )
+    diabetes_hr = np.where(
+        df["has_diabetes"].to_numpy(),
+        HAZARD_RATIOS["diabetes"]["yes"],
+        HAZARD_RATIOS["diabetes"]["no"],
+    )
+    hypertension_hr = np.where(
+        df["has_hypertension"].to_numpy(),
+        HAZARD_RATIOS["hypertension"]["yes"],
+        HAZARD_RATIOS["hypertension"]["no"],
+    )
 
-    return hr
+    return bmi_hr * exercise_hr * sleep_hr * smoking_hr * diabetes_hr * hypertension_hr
 
 
 def process_nhanes_data(file_paths: Dict[str, Path]) -> pd.DataFrame:
@@ -456,22 +484,38 @@ def process_nhanes_data(file_paths: Dict[str, Path]) -> pd.DataFrame:
 
     # Compute exercise hours
     print("\nComputing exercise hours...")
-    df["exercise_hours"] = df.apply(compute_exercise_hours_per_week, axis=1)
+    df["exercise_hours"] = compute_exercise_hours_per_week(df)
 
-    # Compute risk factor categories
+    # Compute risk factor categories (C-level bucketization instead of
+    # one Python call per row)
     print("Computing risk factor categories...")
-    df["bmi_category"] = df["BMXBMI"].apply(classify_bmi)
-    df["exercise_category"] = df["exercise_hours"].apply(classify_exercise)
-    df["sleep_category"] = df["sleep_hours"].apply(classify_sleep)
-    df["is_smoker"] = df.apply(
-        lambda r: is_current_smoker(r.get("SMQ020"), r.get("SMQ040")), axis=1
+    bmi = df["BMXBMI"].to_numpy(dtype=np.float64, na_value=np.nan)
+    bmi = np.where(np.isnan(bmi), 20.0, bmi)  # default missing to "normal"
+    df["bmi_category"] = BMI_LABELS[np.searchsorted(BMI_EDGES, bmi, side="right")]
+
+    hours = df["exercise_hours"].to_numpy(dtype=np.float64, na_value=np.nan)
+    exercise = EXERCISE_LABELS[np.searchsorted(EXERCISE_EDGES, hours, side="right")]
+    df["exercise_category"] = np.where(
+        np.isnan(hours) | (hours == 0), "none", exercise
+    )
+
+    sleep = df["sleep_hours"].to_numpy(dtype=np.float64, na_value=np.nan)
+    sleep = np.where(np.isnan(sleep), 7.0, sleep)  # default missing to "normal"
+    df["sleep_category"] = SLEEP_LABELS[np.searchsorted(SLEEP_EDGES, sleep, side="right")]
+    # Binary factors as columnar boolean algebra; NaN comparisons are
+    # False, matching the scalar helpers these replace.
+    # Smoker: SMQ020=1 (100+ cigarettes) and SMQ040 in [1, 2] (current)
+    df["is_smoker"] = (df["SMQ020"].to_numpy() == 1) & np.isin(
+        df["SMQ040"].to_numpy(), (1.0, 2.0)
     )
-    df["has_diabetes"] = df["DIQ010"].apply(has_diabetes)
-    df["has_hypertension"] = df["BPQ020"].apply(has_hypertension)
+    # DIQ010=1: told by doctor have diabetes
+    df["has_diabetes"] = df["DIQ010"].to_numpy() == 1
+    # BPQ020=1: told by doctor have high blood pressure
+    df["has_hypertension"] = df["BPQ020"].to_numpy() == 1
 
     # Compute individual hazard ratios
     print("Computing individual hazard ratios...")
-    df["individual_hr"] = df.apply(compute_individual_hr, axis=1)
+    df["individual_hr"] = compute_individual_hr(df)
 
     # Assign age groups
     df["age_group"] = pd.cut(
@@ -515,67 +559,64 @@ def compute_calibration_factors(df: pd.DataFrame) -> Dict:
         "overall": {},
     }
 
-    # Overall weighted average
-    overall_hr = np.average(df["individual_hr"], weights=df["weight"])
-    calibration["overall"]["weighted_mean_hr"] = round(overall_hr, 4)
+    # Weighted mean HR per grouping via single groupby passes instead of
+    # one masked sub-frame per cell
+    w = df["weight"]
+    w_sum = w.sum()
+    hrw = df["individual_hr"] * w
+
+    def weighted_hr(keys) -> Tuple[pd.Series, pd.Series]:
+        grouped_w = w.groupby(keys, observed=True)
+        hr = (hrw.groupby(keys, observed=True).sum() / grouped_w.sum()).round(4)
+        return hr, grouped_w.size()
+
+    # Overall weighted average. Scalars off the frame are numpy floats -
+    # float32 when the parquet cache is in play - and np.float32 is not a
+    # float subclass, so the stdlib json fallback rejects it; coerce every
+    # value destined for the calibration dict to a plain float
+    calibration["overall"]["weighted_mean_hr"] = round(float(hrw.sum() / w_sum), 4)
     calibration["overall"]["n"] = len(df)
 
     # By sex
-    for sex in ["male", "female"]:
-        sex_df = df[df["sex"] == sex]
-        if len(sex_df) > 0:
-            sex_hr = np.average(sex_df["individual_hr"], weights=sex_df["weight"])
-            calibration["by_sex"][sex] = {
-                "weighted_mean_hr": round(sex_hr, 4),
-                "n": len(sex_df),
-            }
+    sex_hr, sex_n = weighted_hr(df["sex"])
+    for sex, hr in sex_hr.items():
+        calibration["by_sex"][sex] = {
+            "weighted_mean_hr": round(float(hr), 4),
+            "n": int(sex_n[sex]),
+        }
 
     # By age group
-    for age_group in df["age_group"].cat.categories:
-        age_df = df[df["age_group"] == age_group]
-        if len(age_df) > 0:
-            age_hr = np.average(age_df["individual_hr"], weights=age_df["weight"])
-            calibration["by_age"][str(age_group)] = {
-                "weighted_mean_hr": round(age_hr, 4),
-                "n": len(age_df),
-            }
+    age_hr, age_n = weighted_hr(df["age_group"])
+    for age_group, hr in age_hr.items():
+        calibration["by_age"][str(age_group)] = {
+            "weighted_mean_hr": round(float(hr), 4),
+            "n": int(age_n[age_group]),
+        }
 
     # By age group AND sex (primary output)
     for age_group in df["age_group"].cat.categories:
         calibration["by_age_sex"][str(age_group)] = {}
-        for sex in ["male", "female"]:
-            subset = df[(df["age_group"] == age_group) & (df["sex"] == sex)]
-            if len(subset) > 0:
-                hr = np.average(subset["individual_hr"], weights=subset["weight"])
-                calibration["by_age_sex"][str(age_group)][sex] = {
-                    "weighted_mean_hr": round(hr, 4),
-                    "n": len(subset),
-                }
-
-    # Prevalence statistics
-    calibration["prevalence"] = {
-        "smoking": round((df["is_smoker"] * df["weight"]).sum() / df["weight"].sum(), 4),
-        "diabetes": round((df["has_diabetes"] * df["weight"]).sum() / df["weight"].sum(), 4),
-        "hypertension": round((df["has_hypertension"] * df["weight"]).sum() / df["weight"].sum(), 4),
-        "bmi_categories": {},
-        "exercise_categories": {},
-        "sleep_categories": {},
-    }
-
-    for cat in df["bmi_category"].unique():
-        mask = df["bmi_category"] == cat
-        prev = (mask * df["weight"]).sum() / df["weight"].sum()
-        calibration["prevalence"]["bmi_categories"][cat] = round(prev, 4)
+    cell_hr, cell_n = weighted_hr([df["age_group"], df["sex"]])
+    for (age_group, sex), hr in cell_hr.items():
+        calibration["by_age_sex"][str(age_group)][sex] = {
+            "weighted_mean_hr": round(float(hr), 4),
+            "n": int(cell_n[(age_group, sex)]),
+        }
 
-    for cat in df["exercise_category"].unique():
-        mask = df["exercise_category"] == cat
-        prev = (mask * df["weight"]).sum() / df["weight"].sum()
-        calibration["prevalence"]["exercise_categories"][cat] = round(prev, 4)
+    # Prevalence statistics: one weighted groupby per categorical column
+    # instead of one full-frame scan per category
+    def weighted_prevalence(col: str) -> Dict[str, float]:
+        shares = (w.groupby(df[col], observed=True).sum() / w_sum).round(4)
+        return {category: round(float(share), 4) for category, share in shares.items()}
 
-    for cat in df["sleep_category"].unique():
-        mask = df["sleep_category"] == cat
-        prev = (mask * df["weight"]).sum() / df["weight"].sum()
-        calibration["prevalence"]["sleep_categories"][cat] = round(prev, 4)
+    calibration["prevalence"] = {
+        "smoking": round(float((df["is_smoker"] * w).sum() / w_sum), 4),
+        "diabetes": round(float((df["has_diabetes"] * w).sum() / w_sum), 4),
+        "hypertension": round(float((df["has_hypertension"] * w).sum() / w_sum), 4),
+        "bmi_categories": weighted_prevalence("bmi_category"),
+        "exercise_categories": weighted_prevalence("exercise_category"),
+        "sleep_categories": weighted_prevalence("sleep_category"),
+    }
 
     return calibration
 
@@ -584,6 +625,55 @@ def compute_calibration_factors(df: pd.DataFrame) -> Dict:
 # Output Generation
 # =============================================================================
 
+def _dumps_indented(obj) -> str:
+    """Serialize obj to 2-space-indented JSON, via orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_compact(obj) -> str:
+    """
+    Serialize obj to compact JSON, via orjson when available.
+
+    Used for the object literals embedded in generated TypeScript,
+    where a bundler discards whitespace anyway; calibration.json keeps
+    the indented form for human readers.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _calibration_hash(calibration: Dict) -> str:
+    """Stable content hash of a calibration dict (key order independent)."""
+    if HAS_ORJSON:
+        payload = orjson.dumps(
+            calibration,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    else:
+        payload = json.dumps(calibration, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes):
+    """
+    Write via temp file, fsync, and rename.
+
+    os.replace is atomic, so an interrupted run never leaves consumers
+    with a truncated calibration.json/calibration.ts.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
 def generate_typescript_file(calibration: Dict, output_path: Path):
     """
     Generate TypeScript file exporting calibration factors.
@@ -594,7 +684,19 @@ def generate_typescript_file(calibration: Dict, output_path: Path):
     This ensures population average matches life tables while still allowing
     individual variation.
     """
-    ts_content = '''/**
+    # Skip the rewrite (and the downstream bundler rebuild it triggers)
+    # when the calibration content is unchanged
+    content_hash = _calibration_hash(calibration)
+    if output_path.exists():
+        with open(output_path) as f:
+            first_line = f.readline().strip()
+        if first_line == f"// hash: {content_hash}":
+            print(f"  TypeScript file unchanged: {output_path}")
+            return
+
+    # Collect fragments and join once at the end (no repeated
+    # reallocation from += on a growing string)
+    parts = [f"// hash: {content_hash}\n", '''/**
  * NHANES Calibration Factors for Baseline QALY Calculation
  *
  * Generated from NHANES 2017-March 2020 (pre-pandemic) microdata.
@@ -629,7 +731,7 @@ export interface CalibrationData {
 export const CALIBRATION_BY_AGE_SEX: Record<
   string,
   Record<"male" | "female", CalibrationData>
-> = '''
+> = ''']
 
     # Format the by_age_sex data
     by_age_sex_formatted = {}
@@ -641,12 +743,12 @@ export const CALIBRATION_BY_AGE_SEX: Record<
                 "n": data["n"],
             }
 
-    ts_content += json.dumps(by_age_sex_formatted, indent=2) + ";\n\n"
+    parts.append(_dumps_compact(by_age_sex_formatted) + ";\n\n")
 
-    ts_content += '''/**
+    parts.append('''/**
  * Overall calibration factors by sex only.
  */
-export const CALIBRATION_BY_SEX: Record<"male" | "female", CalibrationData> = '''
+export const CALIBRATION_BY_SEX: Record<"male" | "female", CalibrationData> = ''')
 
     by_sex_formatted = {}
     for sex, data in calibration["by_sex"].items():
@@ -655,9 +757,9 @@ export const CALIBRATION_BY_SEX: Record<"male" | "female", CalibrationData> = ''
             "n": data["n"],
         }
 
-    ts_content += json.dumps(by_sex_formatted, indent=2) + ";\n\n"
+    parts.append(_dumps_compact(by_sex_formatted) + ";\n\n")
 
-    ts_content += f'''/**
+    parts.append(f'''/**
  * Overall population calibration factor.
  */
 export const CALIBRATION_OVERALL: CalibrationData = {{
@@ -726,13 +828,13 @@ export function getCalibrationFactor(
 /**
  * Prevalence statistics from NHANES (for reference/validation).
  */
-export const POPULATION_PREVALENCE = '''
+export const POPULATION_PREVALENCE = ''')
 
-    ts_content += json.dumps(calibration["prevalence"], indent=2) + ";\n"
+    parts.append(_dumps_compact(calibration["prevalence"]) + ";\n")
+    ts_content = "".join(parts)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(ts_content)
+    _write_atomic(output_path, ts_content.encode())
 
     print(f"  Saved TypeScript file: {output_path}")
 
@@ -757,9 +859,32 @@ def save_outputs(df: pd.DataFrame, calibration: Dict):
     ]
     df_save = df[save_cols].copy()
 
+    # Pin narrow dtypes: dictionary-encoded categoricals and float32
+    # measures keep the file small and let consumers read typed columns
+    df_save = df_save.astype({
+        "SEQN": np.int32,
+        "RIDAGEYR": np.int32,
+        "sex": "category",
+        "cycle": "category",
+        "age_group": "category",
+        "bmi_category": "category",
+        "exercise_category": "category",
+        "sleep_category": "category",
+        "weight": np.float32,
+        "BMXBMI": np.float32,
+        "exercise_hours": np.float32,
+        "sleep_hours": np.float32,
+        "individual_hr": np.float32,
+        "is_smoker": bool,
+        "has_diabetes": bool,
+        "has_hypertension": bool,
+    })
+
     # Try to save as parquet, fall back to CSV if pyarrow not available
     try:
-        df_save.to_parquet(processed_path)
+        df_save.to_parquet(
+            processed_path, compression="snappy", row_group_size=64_000
+        )
         print(f"  Saved processed data: {processed_path}")
     except Exception as e:
         print(f"  Warning: Could not save parquet ({e}), saving as CSV instead")
@@ -769,8 +894,7 @@ def save_outputs(df: pd.DataFrame, calibration: Dict):
 
     # Save calibration as JSON
     calibration_path = DATA_DIR / "calibration.json"
-    with open(calibration_path, "w") as f:
-        json.dump(calibration, f, indent=2)
+    _write_atomic(calibration_path, _dumps_indented(calibration).encode())
     print(f"  Saved calibration factors: {calibration_path}")
 
     # Generate TypeScript file
@@ -778,6 +902,29 @@ def save_outputs(df: pd.DataFrame, calibration: Dict):
     generate_typescript_file(calibration, ts_path)
 
 
+def load_processed_if_fresh() -> Optional[pd.DataFrame]:
+    """
+    Return the cached processed DataFrame if it is still up to date.
+
+    The cache is fresh when data/nhanes/processed.parquet exists and is
+    newer than every raw XPT file; otherwise returns None and the full
+    download/merge/categorize pipeline runs.
+    """
+    processed_path = DATA_DIR / "processed.parquet"
+    if not processed_path.exists():
+        return None
+
+    raw_mtimes = [p.stat().st_mtime for p in RAW_DIR.glob("*.XPT")]
+    if raw_mtimes and max(raw_mtimes) >= processed_path.stat().st_mtime:
+        return None
+
+    try:
+        return pd.read_parquet(processed_path)
+    except Exception as e:
+        print(f"  Warning: Could not read {processed_path} ({e}), reprocessing")
+        return None
+
+
 def print_summary(calibration: Dict):
     """Print summary statistics."""
     print("\n" + "=" * 60)
@@ -823,19 +970,24 @@ def main():
     print("NHANES Microdata Calibration for Optiqal")
     print("=" * 60)
 
-    # Download NHANES files
-    print("\nDownloading NHANES files...")
-    file_paths = download_nhanes_files()
-
-    # Check all files exist
-    missing = [name for name, path in file_paths.items() if not path.exists()]
-    if missing:
-        print(f"\nERROR: Missing files: {missing}")
-        print("Please check your internet connection and try again.")
-        sys.exit(1)
-
-    # Process data
-    df = process_nhanes_data(file_paths)
+    # Reuse the processed microdata when no raw file has changed
+    df = load_processed_if_fresh()
+    if df is not None:
+        print("\nUsing cached processed data (processed.parquet is up to date)")
+    else:
+        # Download NHANES files
+        print("\nDownloading NHANES files...")
+        file_paths = download_nhanes_files()
+
+        # Check all files exist
+        missing = [name for name, path in file_paths.items() if not path.exists()]
+        if missing:
+            print(f"\nERROR: Missing files: {missing}")
+            print("Please check your internet connection and try again.")
+            sys.exit(1)
+
+        # Process data
+        df = process_nhanes_data(file_paths)
 
     # Compute calibration factors
     calibration = compute_calibration_factors(df)
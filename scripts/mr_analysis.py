@@ -12,12 +12,24 @@ References:
 }
 """
 
+import gc
 import gzip
+from bisect import bisect_left, insort
+
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Tuple
 from scipy import stats
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # Configuration
 DATA_DIR = Path("data/pan-ukb/sumstats")
 OUTPUT_DIR = Path("data/pan-ukb/results")
@@ -30,42 +42,165 @@ CLUMP_KB = 10000  # 10Mb window
 CLUMP_R2 = 0.001  # Conservative LD threshold
 
 
+# Columns actually consumed downstream; files only carry a subset
+# (continuous traits have _EUR columns, binary traits add _meta_hq)
+PANUKB_COLUMNS = [
+    'chr', 'pos', 'ref', 'alt',
+    'beta_EUR', 'se_EUR', 'neglog10_pval_EUR', 'af_EUR',
+    'beta_meta_hq', 'se_meta_hq', 'neglog10_pval_meta_hq', 'af_controls_EUR',
+]
+
+# float32 is ample for effect sizes and allele frequencies and halves
+# the in-memory footprint of a ~30M-row GWAS frame
+PANUKB_FLOAT_COLUMNS = [
+    'beta_EUR', 'se_EUR', 'neglog10_pval_EUR', 'af_EUR',
+    'beta_meta_hq', 'se_meta_hq', 'neglog10_pval_meta_hq', 'af_controls_EUR',
+]
+
+
 def read_panukb(filename: str, chunksize: int = 1_000_000) -> pd.DataFrame:
-    """Read Pan-UKB summary statistics (bgzip compressed TSV)"""
+    """
+    Read Pan-UKB summary statistics (bgzip compressed TSV).
+
+    The first read re-encodes the file as a zstd parquet sibling
+    (bmi.tsv.bgz -> bmi.parquet); repeat runs read that instead,
+    skipping the full TSV decompress+parse and touching only the
+    columns the analysis consumes.
+    """
     filepath = DATA_DIR / filename
+    cache_path = filepath.with_name(filename.split('.')[0] + '.parquet')
+
+    if cache_path.exists() and cache_path.stat().st_mtime > filepath.stat().st_mtime:
+        print(f"Reading cached: {cache_path}")
+        try:
+            if HAS_PYARROW:
+                import pyarrow.parquet as pq
+                schema_names = pq.read_schema(cache_path).names
+                columns = [c for c in PANUKB_COLUMNS if c in schema_names]
+                df = pd.read_parquet(cache_path, columns=columns)
+            else:
+                df = pd.read_parquet(cache_path)
+            print(f"  Total: {len(df):,} variants")
+            return df
+        except Exception as e:
+            print(f"  Warning: Could not read cache ({e}), re-parsing TSV")
+
     print(f"Reading: {filepath}")
 
-    # Read in chunks for memory efficiency
-    chunks = []
-    with gzip.open(filepath, 'rt') as f:
-        reader = pd.read_csv(f, sep='\t', chunksize=chunksize)
-        for i, chunk in enumerate(reader):
-            chunks.append(chunk)
-            if (i + 1) % 10 == 0:
-                print(f"  Loaded {(i + 1) * chunksize:,} variants...")
+    if HAS_PYARROW:
+        # Multithreaded block-parallel parse, projected to the columns we
+        # use, streamed through a gzip decompressor (bgzip is gzip-framed)
+        with gzip.open(filepath, 'rt') as f:
+            header = f.readline().rstrip('\n').split('\t')
+        include = [c for c in PANUKB_COLUMNS if c in header]
+
+        with pa.CompressedInputStream(pa.OSFile(str(filepath), 'rb'), 'gzip') as stream:
+            table = pacsv.read_csv(
+                stream,
+                read_options=pacsv.ReadOptions(block_size=32 << 20),
+                parse_options=pacsv.ParseOptions(delimiter='\t'),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=include,
+                    column_types={
+                        'chr': pa.string(),
+                        'pos': pa.int32(),
+                        **{c: pa.float32() for c in PANUKB_FLOAT_COLUMNS},
+                    },
+                ),
+            )
+        df = table.to_pandas(self_destruct=True)
+    else:
+        # Read in chunks for memory efficiency
+        chunks = []
+        dtypes = {
+            'chr': 'category',
+            'pos': 'int32',
+            **{c: 'float32' for c in PANUKB_FLOAT_COLUMNS},
+        }
+        with gzip.open(filepath, 'rt') as f:
+            reader = pd.read_csv(f, sep='\t', chunksize=chunksize, dtype=dtypes)
+            for i, chunk in enumerate(reader):
+                chunks.append(chunk)
+                if (i + 1) % 10 == 0:
+                    print(f"  Loaded {(i + 1) * chunksize:,} variants...")
+        df = pd.concat(chunks, ignore_index=True)
+
+    try:
+        df.to_parquet(cache_path, compression="zstd")
+        print(f"  Cached as parquet: {cache_path}")
+    except Exception:
+        pass  # cache is best-effort; parquet engine may be missing
 
-    df = pd.concat(chunks, ignore_index=True)
     print(f"  Total: {len(df):,} variants")
     return df
 
 
+def make_snp_ids(df: pd.DataFrame) -> pd.Series:
+    """
+    Build chr:pos:ref:alt SNP IDs in a single pass.
+
+    With pyarrow available the join runs in C over contiguous string
+    arrays; the fallback uses str.cat, which makes one pass instead of
+    the three chained + concatenations (each of which materializes a
+    full object-dtype intermediate).
+    """
+    if HAS_PYARROW:
+        joined = pc.binary_join_element_wise(
+            pa.array(df['chr'].astype(str)),
+            pa.array(df['pos'].astype(str)),
+            pa.array(df['ref'], type=pa.string()),
+            pa.array(df['alt'], type=pa.string()),
+            ':',
+        )
+        return pd.Series(joined.to_pandas().to_numpy(), index=df.index)
+    return df['chr'].astype(str).str.cat(
+        [df['pos'].astype(str), df['ref'], df['alt']], sep=':'
+    )
+
+
+# Deterministic chromosome codes so merge keys agree across GWAS files
+CHR_CODES = {str(i): i for i in range(1, 23)}
+CHR_CODES.update({"X": 23, "Y": 24, "XY": 25, "MT": 26, "M": 26})
+
+
+def make_merge_keys(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build int64 merge keys: (chr << 40 | pos, hash of ref/alt).
+
+    Merging on int64 lets pandas use its integer hash table instead of
+    hashing every Python string; the keys are deterministic, so the same
+    variant gets the same keys in every GWAS file.
+
+    Returns:
+        (snp_key, allele_key) int64 arrays aligned with df
+    """
+    chrom = df['chr'].astype(str).map(CHR_CODES).fillna(0).to_numpy(dtype=np.int64)
+    pos = df['pos'].to_numpy(dtype=np.int64)
+    snp_key = (chrom << 40) | pos
+
+    h_ref = pd.util.hash_array(df['ref'].to_numpy(dtype=object))
+    h_alt = pd.util.hash_array(df['alt'].to_numpy(dtype=object))
+    allele_key = (h_ref ^ (h_alt * np.uint64(0x9E3779B97F4A7C15))).view(np.int64)
+    return snp_key, allele_key
+
+
 def extract_instruments(df: pd.DataFrame, p_threshold: float = P_THRESHOLD) -> pd.DataFrame:
     """Extract genome-wide significant SNPs as genetic instruments"""
-    # Pan-UKB uses neglog10_pval_EUR, convert back to p-value
+    # Pan-UKB uses neglog10_pval_EUR; filter in log space (p < t is
+    # -log10 p > -log10 t) so only the handful of surviving rows pay
+    # for the 10**-x conversion instead of all ~30M variants
     if 'neglog10_pval_EUR' in df.columns:
-        df['pval_EUR'] = 10 ** (-df['neglog10_pval_EUR'])
-
-    # Filter to significant SNPs
-    instruments = df[df['pval_EUR'] < p_threshold].copy()
+        mask = df['neglog10_pval_EUR'].to_numpy() > -np.log10(p_threshold)
+        instruments = df[mask].copy()
+        instruments['pval_EUR'] = np.power(
+            10.0, -instruments['neglog10_pval_EUR'].to_numpy()
+        )
+    else:
+        instruments = df[df['pval_EUR'] < p_threshold].copy()
     print(f"Found {len(instruments):,} genome-wide significant SNPs (p < {p_threshold})")
 
     # Create unique SNP ID
-    instruments['SNP'] = (
-        instruments['chr'].astype(str) + ':' +
-        instruments['pos'].astype(str) + ':' +
-        instruments['ref'] + ':' +
-        instruments['alt']
-    )
+    instruments['SNP'] = make_snp_ids(instruments)
 
     return instruments
 
@@ -75,28 +210,30 @@ def clump_local(instruments: pd.DataFrame, kb: int = CLUMP_KB) -> pd.DataFrame:
     print(f"Clumping with {kb}kb window...")
 
     # Sort by p-value (best first)
-    instruments = instruments.sort_values('pval_EUR').copy()
-
-    keep = []
-    kept_positions = {}  # chr -> list of positions
-
-    for _, row in instruments.iterrows():
-        chr_key = row['chr']
-        pos = row['pos']
-
-        # Check if too close to any kept SNP on same chromosome
-        if chr_key in kept_positions:
-            distances = np.abs(np.array(kept_positions[chr_key]) - pos)
-            if np.any(distances < kb * 1000):
-                continue
-
-        # Keep this SNP
-        keep.append(row)
-        if chr_key not in kept_positions:
-            kept_positions[chr_key] = []
-        kept_positions[chr_key].append(pos)
-
-    result = pd.DataFrame(keep)
+    instruments = instruments.sort_values('pval_EUR')
+
+    # Greedy sweep over plain arrays: each kept-position list stays sorted,
+    # so the nearest kept neighbor is a bisect away (O(N log K) total,
+    # no per-row pandas boxing)
+    chr_codes, _ = pd.factorize(instruments['chr'])
+    positions = instruments['pos'].to_numpy(dtype=np.int64)
+    window = kb * 1000
+
+    keep = np.zeros(len(positions), dtype=bool)
+    kept_positions = {}  # chr code -> sorted list of kept positions
+
+    for i in range(len(positions)):
+        pos = positions[i]
+        kept = kept_positions.setdefault(chr_codes[i], [])
+        j = bisect_left(kept, pos)
+        if j > 0 and pos - kept[j - 1] < window:
+            continue
+        if j < len(kept) and kept[j] - pos < window:
+            continue
+        insort(kept, pos)
+        keep[i] = True
+
+    result = instruments[keep].copy()
     print(f"After clumping: {len(result):,} independent SNPs")
     return result
 
@@ -105,46 +242,71 @@ def harmonize_data(instruments: pd.DataFrame, outcome: pd.DataFrame) -> pd.DataF
     """Look up instruments in outcome GWAS and harmonize alleles"""
     print("Looking up instruments in outcome GWAS...")
 
-    # Create SNP ID in outcome
-    outcome = outcome.copy()
-    outcome['SNP'] = (
-        outcome['chr'].astype(str) + ':' +
-        outcome['pos'].astype(str) + ':' +
-        outcome['ref'] + ':' +
-        outcome['alt']
-    )
+    # Int64 merge keys (cheaper than building and hashing chr:pos:ref:alt
+    # strings for every outcome variant)
+    snp_key, allele_key = make_merge_keys(outcome)
+    instruments = instruments.copy()
+    instruments['snp_key'], instruments['allele_key'] = make_merge_keys(instruments)
 
-    # Handle different column naming for binary vs continuous traits
-    # Binary traits (T2DM, MI) use _meta or _EUR suffixes with different structure
+    # Handle different column naming for binary vs continuous traits.
+    # Project the outcome GWAS into a narrow lookup frame rather than
+    # copying the full ~30M-row DataFrame; p-values are derived after
+    # the merge, on the few matched rows only
     if 'beta_meta_hq' in outcome.columns:
         # Use meta-analysis results (higher quality)
-        outcome['beta_out'] = outcome['beta_meta_hq']
-        outcome['se_out'] = outcome['se_meta_hq']
-        outcome['pval_out'] = 10 ** (-outcome['neglog10_pval_meta_hq'])
-        outcome['af_out'] = outcome['af_controls_EUR'] if 'af_controls_EUR' in outcome.columns else 0.5
+        lookup = pd.DataFrame({
+            'snp_key': snp_key,
+            'allele_key': allele_key,
+            'beta_out': outcome['beta_meta_hq'].to_numpy(),
+            'se_out': outcome['se_meta_hq'].to_numpy(),
+            'neglog10_pval_out': outcome['neglog10_pval_meta_hq'].to_numpy(),
+            'af_out': (
+                outcome['af_controls_EUR'].to_numpy()
+                if 'af_controls_EUR' in outcome.columns else 0.5
+            ),
+            'alt': outcome['alt'].to_numpy(),
+            'ref': outcome['ref'].to_numpy(),
+        })
         print("  Using meta-analysis (HQ) results for binary outcome")
     elif 'beta_EUR' in outcome.columns:
-        outcome['beta_out'] = outcome['beta_EUR']
-        outcome['se_out'] = outcome['se_EUR']
+        lookup = pd.DataFrame({
+            'snp_key': snp_key,
+            'allele_key': allele_key,
+            'beta_out': outcome['beta_EUR'].to_numpy(),
+            'se_out': outcome['se_EUR'].to_numpy(),
+            'af_out': (
+                outcome['af_EUR'].to_numpy()
+                if 'af_EUR' in outcome.columns else 0.5
+            ),
+            'alt': outcome['alt'].to_numpy(),
+            'ref': outcome['ref'].to_numpy(),
+        })
         if 'neglog10_pval_EUR' in outcome.columns:
-            outcome['pval_out'] = 10 ** (-outcome['neglog10_pval_EUR'])
+            lookup['neglog10_pval_out'] = outcome['neglog10_pval_EUR'].to_numpy()
+        elif 'pval_EUR' in outcome.columns:
+            lookup['pval_out'] = outcome['pval_EUR'].to_numpy()
         else:
-            outcome['pval_out'] = outcome.get('pval_EUR', 0.5)
-        outcome['af_out'] = outcome.get('af_EUR', 0.5)
+            lookup['pval_out'] = 0.5
         print("  Using EUR ancestry results")
     else:
         raise ValueError(f"Cannot find beta columns. Available: {list(outcome.columns)[:10]}")
 
     # Merge
     merged = instruments.merge(
-        outcome[['SNP', 'beta_out', 'se_out', 'pval_out', 'af_out', 'alt', 'ref']],
-        on='SNP',
+        lookup,
+        on=['snp_key', 'allele_key'],
         how='left',
         suffixes=('_exp', '_out')
     )
+    del lookup
+    gc.collect()
 
     # Keep only matched SNPs
-    matched = merged.dropna(subset=['beta_out'])
+    matched = merged.dropna(subset=['beta_out']).copy()
+    if 'neglog10_pval_out' in matched.columns:
+        matched['pval_out'] = np.power(
+            10.0, -matched.pop('neglog10_pval_out').to_numpy()
+        )
     print(f"Matched {len(matched):,} of {len(instruments):,} instruments")
 
     # Check allele alignment and flip if needed
@@ -157,6 +319,30 @@ def harmonize_data(instruments: pd.DataFrame, outcome: pd.DataFrame) -> pd.DataF
     return matched
 
 
+def weighted_median(values: np.ndarray, weights: np.ndarray) -> float:
+    """
+    Smallest value whose cumulative weight reaches half the total.
+
+    Selection by repeated np.argpartition halving - O(N) on average -
+    instead of a full argsort plus cumsum, which only ever gets read at
+    the single crossing index.
+    """
+    idx = np.arange(len(values))
+    target = 0.5 * weights.sum()
+    below = 0.0
+    while len(idx) > 1:
+        mid = len(idx) // 2
+        part = np.argpartition(values[idx], mid)
+        left = idx[part[:mid]]
+        left_weight = weights[left].sum()
+        if below + left_weight >= target:
+            idx = left
+        else:
+            below += left_weight
+            idx = idx[part[mid:]]
+    return float(values[idx[0]])
+
+
 def run_mr(harmonized: pd.DataFrame) -> pd.DataFrame:
     """Run MR analysis using multiple methods"""
     print(f"\n=== Running MR Analysis ===")
@@ -170,14 +356,16 @@ def run_mr(harmonized: pd.DataFrame) -> pd.DataFrame:
 
     # Per-SNP Wald ratios
     wald_ratio = beta_out / beta_exp
-    wald_se = np.abs(se_out / beta_exp)  # Approximate SE
 
     results = []
 
     # 1. Inverse Variance Weighted (IVW)
-    weights = 1 / wald_se**2
-    ivw_beta = np.sum(wald_ratio * weights) / np.sum(weights)
-    ivw_se = np.sqrt(1 / np.sum(weights))
+    # 1/wald_se^2 with wald_se = |se_out/beta_exp| collapses to
+    # beta_exp^2/se_out^2, skipping the abs/divide/square round trip
+    weights = (beta_exp * beta_exp) / (se_out * se_out)
+    weights_sum = weights.sum()
+    ivw_beta = np.dot(wald_ratio, weights) / weights_sum
+    ivw_se = 1.0 / np.sqrt(weights_sum)
     ivw_pval = 2 * stats.norm.sf(np.abs(ivw_beta / ivw_se))
 
     results.append({
@@ -191,10 +379,7 @@ def run_mr(harmonized: pd.DataFrame) -> pd.DataFrame:
 
     # 2. Weighted Median (robust to up to 50% invalid instruments)
     if len(harmonized) >= 3:
-        sorted_idx = np.argsort(wald_ratio)
-        cumsum_weights = np.cumsum(weights[sorted_idx]) / np.sum(weights)
-        median_idx = np.where(cumsum_weights >= 0.5)[0][0]
-        wm_beta = wald_ratio[sorted_idx[median_idx]]
+        wm_beta = weighted_median(wald_ratio, weights)
         wm_se = ivw_se * np.sqrt(0.5)  # Approximate
         wm_pval = 2 * stats.norm.sf(np.abs(wm_beta / wm_se))
 
@@ -209,16 +394,22 @@ def run_mr(harmonized: pd.DataFrame) -> pd.DataFrame:
 
     # 3. MR-Egger (tests for pleiotropy)
     if len(harmonized) >= 3:
-        # Weighted regression of beta_out on beta_exp
-        W = np.diag(1 / se_out**2)
-        X = np.column_stack([np.ones(len(beta_exp)), beta_exp])
-        XtWX = X.T @ W @ X
-        XtWy = X.T @ W @ beta_out
+        # Weighted regression of beta_out on beta_exp. The normal
+        # equations are written out as weighted sums: with a diagonal
+        # weight matrix, X'WX is just a 2x2 of moments, so there is no
+        # need to materialize the NxN diagonal
+        w_out = 1 / se_out**2
+        wx = w_out * beta_exp
+        XtWX = np.array([
+            [w_out.sum(), wx.sum()],
+            [wx.sum(), np.dot(wx, beta_exp)],
+        ])
+        XtWy = np.array([np.dot(w_out, beta_out), np.dot(wx, beta_out)])
 
         try:
             coef = np.linalg.solve(XtWX, XtWy)
-            residuals = beta_out - X @ coef
-            sigma2 = np.sum((residuals**2) * np.diag(W)) / (len(beta_exp) - 2)
+            residuals = beta_out - (coef[0] + coef[1] * beta_exp)
+            sigma2 = np.dot(residuals**2, w_out) / (len(beta_exp) - 2)
             var_coef = sigma2 * np.linalg.inv(XtWX)
             se_coef = np.sqrt(np.diag(var_coef))
 
@@ -241,11 +432,14 @@ def run_mr(harmonized: pd.DataFrame) -> pd.DataFrame:
         except np.linalg.LinAlgError:
             print("MR-Egger: Could not compute (singular matrix)")
 
-    # Convert to DataFrame and add odds ratios
+    # Convert to DataFrame and add odds ratios (one exp over the
+    # stacked point estimate and CI bounds)
     df = pd.DataFrame(results)
-    df['OR'] = np.exp(df['beta'])
-    df['OR_lci'] = np.exp(df['beta'] - 1.96 * df['se'])
-    df['OR_uci'] = np.exp(df['beta'] + 1.96 * df['se'])
+    beta = df['beta'].to_numpy()
+    halfwidth = 1.96 * df['se'].to_numpy()
+    or_grid = np.stack([beta, beta - halfwidth, beta + halfwidth])
+    np.exp(or_grid, out=or_grid)
+    df['OR'], df['OR_lci'], df['OR_uci'] = or_grid
 
     return df
 
@@ -265,6 +459,7 @@ def main():
 
     # Free memory
     del bmi
+    gc.collect()
 
     # 2. BMI -> T2DM Analysis
     print("\n--- MR: BMI -> Type 2 Diabetes ---")
@@ -274,6 +469,7 @@ def main():
     print("\nResults:")
     print(mr_bmi_t2dm[['method', 'beta', 'se', 'OR', 'OR_lci', 'OR_uci', 'pval', 'nsnp']].to_string())
     del t2dm
+    gc.collect()
 
     # 3. BMI -> CVD (MI) Analysis
     print("\n--- MR: BMI -> Myocardial Infarction ---")
@@ -283,6 +479,7 @@ def main():
     print("\nResults:")
     print(mr_bmi_mi[['method', 'beta', 'se', 'OR', 'OR_lci', 'OR_uci', 'pval', 'nsnp']].to_string())
     del mi
+    gc.collect()
 
     # 4. Save results
     print("\n--- Saving Results ---")
@@ -66,6 +66,12 @@ def main():
         default=42,
         help="Random seed for reproducibility (default: 42)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -112,6 +118,7 @@ def main():
         results = precompute_all_interventions(
             intervention_dir=intervention_dir,
             output_dir=output_dir,
+            max_workers=args.workers,
             ages=args.ages,
             sexes=args.sexes,
             use_mcmc=False,  # Use fast Monte Carlo
@@ -18,6 +18,8 @@ from pathlib import Path
 # Import from the lifecycle module
 import sys
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "python"))
 
 from optiqal.lifecycle import (
@@ -26,57 +28,97 @@ from optiqal.lifecycle import (
     get_quality_weight,
 )
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Per-age lookup curves, built once per (sex, max_age) instead of one
+# get_* call per simulated year per starting age
+_MORTALITY_CURVES = {}
+_QUALITY_CURVES = {}
+
+
+def _mortality_curve(sex: str, max_age: int) -> np.ndarray:
+    key = (sex, max_age)
+    if key not in _MORTALITY_CURVES:
+        _MORTALITY_CURVES[key] = np.array(
+            [get_mortality_rate(age, sex) for age in range(max_age)]
+        )
+    return _MORTALITY_CURVES[key]
+
+
+def _quality_curve(max_age: int) -> np.ndarray:
+    if max_age not in _QUALITY_CURVES:
+        _QUALITY_CURVES[max_age] = np.array(
+            [get_quality_weight(age) for age in range(max_age)]
+        )
+    return _QUALITY_CURVES[max_age]
+
+
+_ALL_AGES_CACHE = {}
+
+
+def compute_all(sex: str, discount_rate: float = 0.03, max_age: int = 100):
+    """
+    Remaining life expectancy and discounted QALYs for every starting age.
+
+    One survival curve per sex plus reverse cumulative sums give all
+    max_age + 1 starting ages at once: conditional survival from age a is
+    survival[y] / survival[a], so life expectancy is a tail sum of the
+    unconditional curve, and discounting by year-since-a factors into
+    discount(y) / discount(a).
+
+    Returns:
+        (life_expectancy, remaining_qalys) float arrays, each shape
+        (max_age + 1,), indexed by starting age
+    """
+    key = (sex, discount_rate, max_age)
+    cached = _ALL_AGES_CACHE.get(key)
+    if cached is None:
+        qx = _mortality_curve(sex, max_age)
+        # Probability of being alive at the start of each age 0..max_age
+        survival = np.concatenate(([1.0], np.cumprod(1.0 - qx)))
+        quality = _quality_curve(max_age)
+        discount = 1.0 / (1.0 + discount_rate) ** np.arange(max_age + 1)
+
+        def _tail_sums(terms: np.ndarray) -> np.ndarray:
+            # tail[a] = terms[a:].sum(), with a trailing 0 for a == max_age
+            return np.concatenate((np.cumsum(terms[::-1])[::-1], [0.0]))
+
+        life_exp = _tail_sums(survival[:max_age]) / survival
+        qalys = _tail_sums(survival[:max_age] * quality * discount[:max_age]) / (
+            survival * discount
+        )
+        cached = (life_exp, qalys)
+        _ALL_AGES_CACHE[key] = cached
+    return cached
+
 
 def calculate_life_expectancy(start_age: int, sex: str, max_age: int = 100) -> float:
     """Calculate remaining life expectancy from a given age."""
-    survival = 1.0
-    life_years = 0.0
-
-    for year in range(max_age - start_age):
-        current_age = start_age + year
-        qx = get_mortality_rate(current_age, sex)
-
-        # Add expected life years this year
-        life_years += survival
-
-        # Update survival
-        survival *= 1 - qx
-
-        # Early termination if nearly everyone is dead
-        if survival < 0.001:
-            break
-
-    return life_years
+    if start_age >= max_age:
+        return 0.0
+    return float(compute_all(sex, max_age=max_age)[0][start_age])
 
 
 def calculate_remaining_qalys(
     start_age: int, sex: str, discount_rate: float = 0.03, max_age: int = 100
 ) -> float:
     """Calculate remaining QALYs from a given age with discounting."""
-    survival = 1.0
-    qalys = 0.0
-
-    for year in range(max_age - start_age):
-        current_age = start_age + year
-        qx = get_mortality_rate(current_age, sex)
-        quality = get_quality_weight(current_age)
-        discount = 1 / (1 + discount_rate) ** year
-
-        # Add QALY contribution this year
-        qalys += survival * quality * discount
-
-        # Update survival
-        survival *= 1 - qx
-
-        # Early termination
-        if survival < 0.001:
-            break
-
-    return qalys
+    if start_age >= max_age:
+        return 0.0
+    return float(compute_all(sex, discount_rate, max_age)[1][start_age])
 
 
 def precompute_baselines():
-    """Generate all precomputed baseline data."""
+    """Generate all precomputed baseline data.
+
+    Per-age tables are stored as flat arrays indexed by age (0-100) rather
+    than {age: value} dicts: the file is several times smaller and consumers
+    index arr[age] directly instead of arr[str(age)].
+    """
     print("Precomputing baselines...")
 
     data = {
@@ -86,46 +128,49 @@ def precompute_baselines():
             "discount_rate": 0.03,
             "max_age": 100,
         },
-        "life_expectancy": {"male": {}, "female": {}},
-        "remaining_qalys": {"male": {}, "female": {}},
-        "cause_fractions": {},
-        "quality_weights": {},
+        "life_expectancy": {},
+        "remaining_qalys": {},
+        "cause_fractions": [],
+        "quality_weights": [],
     }
 
-    # Precompute for each age 0-100
-    for age in range(101):
-        # Life expectancy by sex
-        for sex in ["male", "female"]:
-            life_exp = calculate_life_expectancy(age, sex)
-            data["life_expectancy"][sex][age] = round(life_exp, 3)
-
-            qalys = calculate_remaining_qalys(age, sex)
-            data["remaining_qalys"][sex][age] = round(qalys, 3)
+    for sex in ["male", "female"]:
+        life_exp, qalys = compute_all(sex)
+        data["life_expectancy"][sex] = np.round(life_exp, 3).tolist()
+        data["remaining_qalys"][sex] = np.round(qalys, 3).tolist()
 
+    for age in range(101):
         # Cause fractions (age-dependent, sex-independent)
         cause_frac = get_cause_fraction(age)
-        data["cause_fractions"][age] = {
+        data["cause_fractions"].append({
             "cvd": round(cause_frac["cvd"], 4),
             "cancer": round(cause_frac["cancer"], 4),
             "other": round(cause_frac["other"], 4),
-        }
+        })
 
         # Quality weights (age-dependent, sex-independent)
-        quality = get_quality_weight(age)
-        data["quality_weights"][age] = round(quality, 4)
-
-        if age % 10 == 0:
-            print(f"  Processed age {age}")
+        data["quality_weights"].append(round(get_quality_weight(age), 4))
 
     return data
 
 
 def save_json(data: dict, output_path: Path):
-    """Save precomputed data as JSON."""
+    """Save precomputed data as JSON (orjson when available)."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    if HAS_ORJSON:
+        # NON_STR_KEYS: the per-age tables are keyed by int, which the
+        # stdlib encoder also stringifies
+        payload = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS,
+        )
+    else:
+        payload = json.dumps(data, indent=2, sort_keys=True).encode()
+    output_path.write_bytes(payload)
 
     print(f"  Saved to {output_path}")
 
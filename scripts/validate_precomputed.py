@@ -10,33 +10,45 @@ This script checks that all precomputed JSON files:
 
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Module-level frozensets: per-record validation runs over 1,000+ results
+# per file, so membership checks should be O(1) set lookups
+_REQUIRED_FIELDS = frozenset([
+    "age", "sex", "qaly_median", "qaly_mean", "qaly_ci95_low", "qaly_ci95_high",
+    "cvd_contribution", "cancer_contribution", "other_contribution",
+    "life_years_gained", "causal_fraction_mean",
+    "causal_fraction_ci95_low", "causal_fraction_ci95_high",
+    "n_samples", "discount_rate", "method"
+])
+_VALID_SEX = frozenset({"male", "female"})
+_VALID_METHOD = frozenset({"monte_carlo", "mcmc"})
+_VALID_CATEGORIES = frozenset({"exercise", "diet", "sleep", "substance", "medical", "stress"})
+
 
 def validate_precomputed_result(result_data: dict, key: str) -> list:
     """Validate a single precomputed result."""
     errors = []
 
-    required_fields = [
-        "age", "sex", "qaly_median", "qaly_mean", "qaly_ci95_low", "qaly_ci95_high",
-        "cvd_contribution", "cancer_contribution", "other_contribution",
-        "life_years_gained", "causal_fraction_mean",
-        "causal_fraction_ci95_low", "causal_fraction_ci95_high",
-        "n_samples", "discount_rate", "method"
-    ]
-
-    for field in required_fields:
-        if field not in result_data:
-            errors.append(f"  {key}: Missing required field '{field}'")
+    # One C-level set difference instead of a per-field Python loop
+    for field in sorted(_REQUIRED_FIELDS - result_data.keys()):
+        errors.append(f"  {key}: Missing required field '{field}'")
 
     # Validate data types
     if "age" in result_data and not isinstance(result_data["age"], int):
         errors.append(f"  {key}: 'age' should be an integer")
 
-    if "sex" in result_data and result_data["sex"] not in ["male", "female"]:
+    if "sex" in result_data and result_data["sex"] not in _VALID_SEX:
         errors.append(f"  {key}: 'sex' should be 'male' or 'female'")
 
-    if "method" in result_data and result_data["method"] not in ["monte_carlo", "mcmc"]:
+    if "method" in result_data and result_data["method"] not in _VALID_METHOD:
         errors.append(f"  {key}: 'method' should be 'monte_carlo' or 'mcmc'")
 
     # Validate numeric ranges
@@ -58,9 +70,13 @@ def validate_precomputed_intervention(file_path: Path) -> tuple[bool, list]:
     errors = []
 
     try:
-        with open(file_path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        # orjson parses these multi-MB files several times faster than
+        # the stdlib decoder
+        if HAS_ORJSON:
+            data = orjson.loads(file_path.read_bytes())
+        else:
+            data = json.loads(file_path.read_bytes())
+    except (json.JSONDecodeError, ValueError) as e:
         return False, [f"Invalid JSON: {e}"]
     except Exception as e:
         return False, [f"Error reading file: {e}"]
@@ -72,9 +88,10 @@ def validate_precomputed_intervention(file_path: Path) -> tuple[bool, list]:
             errors.append(f"Missing required top-level field '{field}'")
 
     # Validate category
-    valid_categories = ["exercise", "diet", "sleep", "substance", "medical", "stress"]
-    if "category" in data and data["category"] not in valid_categories:
-        errors.append(f"Invalid category '{data['category']}', should be one of {valid_categories}")
+    if "category" in data and data["category"] not in _VALID_CATEGORIES:
+        errors.append(
+            f"Invalid category '{data['category']}', should be one of {sorted(_VALID_CATEGORIES)}"
+        )
 
     # Validate results
     if "results" in data:
@@ -118,9 +135,13 @@ def main():
 
     all_valid = True
 
-    for json_file in json_files:
+    # Files are independent read+parse work; validate them in parallel
+    # and report in file order
+    with ProcessPoolExecutor() as executor:
+        outcomes = list(executor.map(validate_precomputed_intervention, json_files))
+
+    for json_file, (is_valid, errors) in zip(json_files, outcomes):
         print(f"\n{json_file.name}")
-        is_valid, errors = validate_precomputed_intervention(json_file)
 
         if is_valid:
             print("  ✓ Valid")
@@ -14,6 +14,16 @@ import {
   type PrecomputedBaselines,
 } from "../precomputed";
 
+// Build a sparse age-indexed array from the entries under test; ages
+// without an entry stay undefined, as a truncated real file would
+function ageArray<T>(entries: Record<number, T>): T[] {
+  const arr = new Array<T>(101);
+  for (const [age, value] of Object.entries(entries)) {
+    arr[Number(age)] = value;
+  }
+  return arr;
+}
+
 // Mock baselines data for testing
 const mockBaselines: PrecomputedBaselines = {
   metadata: {
@@ -23,45 +33,20 @@ const mockBaselines: PrecomputedBaselines = {
     max_age: 100,
   },
   life_expectancy: {
-    male: {
-      "0": 76.4,
-      "40": 38.9,
-      "41": 38.0,
-      "100": 1.2,
-    },
-    female: {
-      "0": 81.8,
-      "40": 43.3,
-      "41": 42.4,
-      "100": 1.3,
-    },
+    male: ageArray({ 0: 76.4, 40: 38.9, 41: 38.0, 100: 1.2 }),
+    female: ageArray({ 0: 81.8, 40: 43.3, 41: 42.4, 100: 1.3 }),
   },
   remaining_qalys: {
-    male: {
-      "0": 27.1,
-      "40": 19.0,
-      "41": 18.8,
-      "100": 0.5,
-    },
-    female: {
-      "0": 27.7,
-      "40": 20.1,
-      "41": 19.9,
-      "100": 0.6,
-    },
-  },
-  cause_fractions: {
-    "0": { cvd: 0.2, cancer: 0.25, other: 0.55 },
-    "40": { cvd: 0.2, cancer: 0.25, other: 0.55 },
-    "41": { cvd: 0.2, cancer: 0.25, other: 0.55 },
-    "100": { cvd: 0.45, cancer: 0.12, other: 0.43 },
-  },
-  quality_weights: {
-    "0": 0.92,
-    "40": 0.89,
-    "41": 0.88,
-    "100": 0.5,
+    male: ageArray({ 0: 27.1, 40: 19.0, 41: 18.8, 100: 0.5 }),
+    female: ageArray({ 0: 27.7, 40: 20.1, 41: 19.9, 100: 0.6 }),
   },
+  cause_fractions: ageArray({
+    0: { cvd: 0.2, cancer: 0.25, other: 0.55 },
+    40: { cvd: 0.2, cancer: 0.25, other: 0.55 },
+    41: { cvd: 0.2, cancer: 0.25, other: 0.55 },
+    100: { cvd: 0.45, cancer: 0.12, other: 0.43 },
+  }),
+  quality_weights: ageArray({ 0: 0.92, 40: 0.89, 41: 0.88, 100: 0.5 }),
 };
 
 describe("Precomputed Baselines", () => {
@@ -181,14 +166,14 @@ describe("Precomputed Baselines", () => {
     });
 
     it("should have cause fractions with all three categories", () => {
-      const fractions = mockBaselines.cause_fractions["40"];
+      const fractions = mockBaselines.cause_fractions[40];
       expect(fractions).toHaveProperty("cvd");
       expect(fractions).toHaveProperty("cancer");
       expect(fractions).toHaveProperty("other");
     });
 
     it("cause fractions should sum to approximately 1", () => {
-      const fractions = mockBaselines.cause_fractions["40"];
+      const fractions = mockBaselines.cause_fractions[40];
       const sum = fractions.cvd + fractions.cancer + fractions.other;
       expect(sum).toBeCloseTo(1.0, 2);
     });
@@ -12,23 +12,21 @@ export interface PrecomputedBaselines {
     discount_rate: number;
     max_age: number;
   };
+  // Per-age tables are flat arrays indexed by age (0..max_age)
   life_expectancy: {
-    male: Record<string, number>;
-    female: Record<string, number>;
+    male: number[];
+    female: number[];
   };
   remaining_qalys: {
-    male: Record<string, number>;
-    female: Record<string, number>;
+    male: number[];
+    female: number[];
   };
-  cause_fractions: Record<
-    string,
-    {
-      cvd: number;
-      cancer: number;
-      other: number;
-    }
-  >;
-  quality_weights: Record<string, number>;
+  cause_fractions: Array<{
+    cvd: number;
+    cancer: number;
+    other: number;
+  }>;
+  quality_weights: number[];
 }
 
 let cachedBaselines: PrecomputedBaselines | null = null;
@@ -70,12 +68,12 @@ export function getPrecomputedLifeExpectancy(
 
   if (sex === "other") {
     // Average male and female
-    const male = baselines.life_expectancy.male[roundedAge.toString()];
-    const female = baselines.life_expectancy.female[roundedAge.toString()];
+    const male = baselines.life_expectancy.male[roundedAge];
+    const female = baselines.life_expectancy.female[roundedAge];
     return (male + female) / 2;
   }
 
-  return baselines.life_expectancy[sex][roundedAge.toString()] ?? null;
+  return baselines.life_expectancy[sex][roundedAge] ?? null;
 }
 
 /**
@@ -95,12 +93,12 @@ export function getPrecomputedRemainingQALYs(
 
   if (sex === "other") {
     // Average male and female
-    const male = baselines.remaining_qalys.male[roundedAge.toString()];
-    const female = baselines.remaining_qalys.female[roundedAge.toString()];
+    const male = baselines.remaining_qalys.male[roundedAge];
+    const female = baselines.remaining_qalys.female[roundedAge];
     return (male + female) / 2;
   }
 
-  return baselines.remaining_qalys[sex][roundedAge.toString()] ?? null;
+  return baselines.remaining_qalys[sex][roundedAge] ?? null;
 }
 
 /**
@@ -116,7 +114,7 @@ export function getPrecomputedCauseFractions(
     return null;
   }
 
-  return baselines.cause_fractions[roundedAge.toString()] ?? null;
+  return baselines.cause_fractions[roundedAge] ?? null;
 }
 
 /**
@@ -132,5 +130,5 @@ export function getPrecomputedQualityWeight(
     return null;
   }
 
-  return baselines.quality_weights[roundedAge.toString()] ?? null;
+  return baselines.quality_weights[roundedAge] ?? null;
 }